@@ -0,0 +1,30 @@
+"""Add composite user indexes to interview_sessions
+
+Revision ID: 002
+Revises: 001
+Create Date: 2025-01-14 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Newest-first session listing per user
+    op.create_index('idx_sessions_user_created', 'interview_sessions',
+                    ['user_id', sa.text('created_at DESC')])
+    # Per-user score aggregates
+    op.create_index('idx_sessions_user_score', 'interview_sessions',
+                    ['user_id', 'overall_score'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_sessions_user_score', table_name='interview_sessions')
+    op.drop_index('idx_sessions_user_created', table_name='interview_sessions')
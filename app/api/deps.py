@@ -1,13 +1,15 @@
 """
 API dependencies for authentication and database access.
 """
+import logging
 from typing import AsyncGenerator, Optional
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import decode_token
+from app.core.security import decode_token, decode_token_cached
+from app.core.logging import get_logger
 from app.core.sentry import set_user_context, add_breadcrumb
 from app.db.base import get_db
 from app.models.user import User
@@ -16,15 +18,23 @@ from app.services.user_service import UserService
 # HTTP Bearer token security
 security = HTTPBearer()
 
+# Loggers behind set_user_context / add_breadcrumb; both log at INFO
+_user_context_logger = get_logger("user_context")
+_breadcrumb_logger = get_logger("breadcrumb")
+
 
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db),
 ) -> User:
     """
     Dependency to get the current authenticated user.
 
+    Reuses the payload decoded by JWTAuthMiddleware when available.
+
     Args:
+        request: Incoming request
         credentials: HTTP Bearer token credentials
         db: Database session
 
@@ -34,8 +44,9 @@ async def get_current_user(
     Raises:
         HTTPException: If token is invalid or user not found
     """
-    token = credentials.credentials
-    payload = decode_token(token)
+    payload = getattr(request.state, "jwt_payload", None)
+    if payload is None:
+        payload = decode_token_cached(credentials.credentials)
 
     if payload is None:
         raise HTTPException(
@@ -60,7 +71,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = await UserService.get_by_id(db, int(user_id))
+    user = await UserService.get_by_id_cached(db, int(user_id))
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -74,41 +85,28 @@ async def get_current_user(
             detail="Inactive user",
         )
 
-    # Set user context in Sentry for error tracking
-    set_user_context(
-        user_id=str(user.id),
-        email=user.email,
-        name=user.name,
-    )
+    # Set user context for error tracking, skipping the work when nothing would be logged
+    if _user_context_logger.isEnabledFor(logging.INFO):
+        set_user_context(
+            user_id=str(user.id),
+            email=user.email,
+            name=user.name,
+        )
 
-    add_breadcrumb(
-        f"User authenticated: {user.email}",
-        category="auth",
-        level="info",
-        data={"user_id": str(user.id)}
-    )
+    if _breadcrumb_logger.isEnabledFor(logging.INFO):
+        add_breadcrumb(
+            f"User authenticated: {user.email}",
+            category="auth",
+            level="info",
+            data={"user_id": str(user.id)}
+        )
 
     return user
 
 
-async def get_current_active_user(
-    current_user: User = Depends(get_current_user),
-) -> User:
-    """
-    Dependency to get the current active user.
-
-    Args:
-        current_user: Current user from token
-
-    Returns:
-        Active user
-
-    Raises:
-        HTTPException: If user is not active
-    """
-    if not current_user.is_active:
-        raise HTTPException(status_code=400, detail="Inactive user")
-    return current_user
+# get_current_user already rejects inactive users; aliasing the callable lets
+# FastAPI's per-request dependency cache resolve both names with a single call
+get_current_active_user = get_current_user
 
 
 def verify_refresh_token(token: str) -> Optional[dict]:
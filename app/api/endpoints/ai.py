@@ -6,10 +6,9 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from app.api.deps import get_current_user
 from app.models.user import User
 from app.schemas.ai import ChatRequest, ChatResponse
-from app.services.ai_service import AIService
+from app.services.registry import ai_service
 
 router = APIRouter()
-ai_service = AIService()
 
 
 @router.post("/chat", response_model=ChatResponse)
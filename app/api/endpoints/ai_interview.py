@@ -9,7 +9,8 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
 
-from app.api.deps import get_db, get_current_user
+from app.api.deps import get_current_user
+from app.db.base import get_db
 from app.models.user import User
 from app.models.user_profile import UserProfile
 from app.models.ai_interview_session import AIInterviewSession, SessionStatus, InterviewType
@@ -31,7 +32,7 @@ from app.schemas.ai_interview import (
 from app.services.rag_service import RAGService
 from app.services.langgraph_interview_service import LangGraphInterviewService
 from app.services.assessment_service import AssessmentService
-from app.services.tts_service import TTSService
+from app.services.registry import tts_service
 from app.services.third_party_tools import generate_livekit_token, create_livekit_room
 from app.core.logging import get_logger
 from app.core.sentry import capture_exception
@@ -43,7 +44,6 @@ router = APIRouter()
 rag_service = RAGService()
 interview_service = LangGraphInterviewService()
 assessment_service = AssessmentService()
-tts_service = TTSService()
 
 
 # User Profile Endpoints
@@ -511,26 +511,19 @@ async def get_ai_interview_session(
         )
         interactions = interactions_result.scalars().all()
 
-        # Add presigned URLs for AI audio
-        interactions_with_audio = []
-        for interaction in interactions:
-            interaction_dict = {
+        # Add presigned URLs for AI audio, signed in one batch
+        audio_urls = await tts_service.get_audio_urls(
+            (i.ai_audio_s3_key for i in interactions if i.ai_audio_s3_key),
+            expiration=3600  # 1 hour
+        )
+        interactions_with_audio = [
+            {
                 **interaction.__dict__,
-                "ai_audio_url": None
+                "ai_audio_url": audio_urls.get(interaction.ai_audio_s3_key)
+                if interaction.ai_audio_s3_key else None,
             }
-
-            # Generate presigned URL for AI audio if it exists
-            if interaction.ai_audio_s3_key:
-                try:
-                    ai_audio_url = await tts_service.get_audio_url(
-                        interaction.ai_audio_s3_key,
-                        expiration=3600  # 1 hour
-                    )
-                    interaction_dict["ai_audio_url"] = ai_audio_url
-                except Exception as e:
-                    logger.warning(f"Failed to generate audio URL for interaction {interaction.id}: {e}")
-
-            interactions_with_audio.append(interaction_dict)
+            for interaction in interactions
+        ]
 
         # Build response
         response_data = {
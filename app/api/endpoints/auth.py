@@ -6,7 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
 from app.api.deps import get_current_user, verify_refresh_token
-from app.core.security import create_access_token, create_refresh_token
+from app.core.security import create_token_pair
 from app.db.base import get_db
 from app.models.user import User
 from app.schemas.user import (
@@ -18,6 +18,7 @@ from app.schemas.user import (
     RefreshTokenRequest,
     RefreshTokenResponse,
 )
+from app.services.rag_service import RAGService
 from app.services.user_service import UserService
 
 router = APIRouter()
@@ -41,25 +42,17 @@ async def register(
     Raises:
         HTTPException: If email already exists
     """
-    # Check if user already exists
-    existing_user = await UserService.get_by_email(db, user_data.email)
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered",
-        )
-
     try:
-        # Create new user
+        # Create new user; duplicate emails are rejected by the unique
+        # constraint on users.email
         user = await UserService.create_user(db, user_data)
         await db.commit()
 
         # Generate tokens
-        access_token = create_access_token(data={"sub": str(user.id)})
-        refresh_token = create_refresh_token(data={"sub": str(user.id)})
+        access_token, refresh_token = await create_token_pair({"sub": str(user.id)})
 
         return TokenResponse(
-            user=UserResponse.from_orm_model(user),
+            user=UserResponse.model_validate(user),
             token=access_token,
             refresh_token=refresh_token,
         )
@@ -99,11 +92,10 @@ async def login(
         )
 
     # Generate tokens
-    access_token = create_access_token(data={"sub": str(user.id)})
-    refresh_token = create_refresh_token(data={"sub": str(user.id)})
+    access_token, refresh_token = await create_token_pair({"sub": str(user.id)})
 
     return TokenResponse(
-        user=UserResponse.from_orm_model(user),
+        user=UserResponse.model_validate(user),
         token=access_token,
         refresh_token=refresh_token,
     )
@@ -138,11 +130,8 @@ async def refresh_token(
             detail="Invalid refresh token",
         )
 
-    # Generate new access token
-    access_token = create_access_token(data={"sub": str(user.id)})
-
-    # Optionally generate new refresh token (token rotation)
-    new_refresh_token = create_refresh_token(data={"sub": str(user.id)})
+    # Generate new access token and rotate the refresh token
+    access_token, new_refresh_token = await create_token_pair({"sub": str(user.id)})
 
     return RefreshTokenResponse(
         access_token=access_token,
@@ -189,7 +178,9 @@ async def update_profile(
     try:
         updated_user = await UserService.update_user(db, current_user, user_data)
         await db.commit()
-        return UserResponse.from_orm_model(updated_user)
+        UserService.invalidate_cache(current_user.id)
+        RAGService.invalidate_cache(current_user.id)
+        return UserResponse.model_validate(updated_user)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -214,4 +205,4 @@ async def get_profile(current_user: User = Depends(get_current_user)):
     Returns:
         User profile data
     """
-    return UserResponse.from_orm_model(current_user)
+    return UserResponse.model_validate(current_user)
@@ -1,11 +1,15 @@
 """
 Interview session API endpoints.
 """
+from typing import AsyncIterator
+
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user
-from app.db.base import get_db
+from app.db.base import async_session_maker, get_db
 from app.models.user import User
 from app.schemas.session import (
     InterviewSessionCreate,
@@ -14,10 +18,14 @@ from app.schemas.session import (
     InterviewFeedback,
 )
 from app.services.session_service import SessionService
-from app.services.ai_service import AIService
+from app.services.registry import ai_service
 
 router = APIRouter()
-ai_service = AIService()
+
+
+def _sse_event(event: str, data: dict) -> bytes:
+    """Encode one Server-Sent Event."""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
 
 
 @router.post("", response_model=InterviewSessionResponse, status_code=status.HTTP_201_CREATED)
@@ -39,7 +47,7 @@ async def create_session(
     """
     session = await SessionService.create_session(db, current_user.id, session_data)
     await db.commit()
-    return InterviewSessionResponse.from_orm_model(session)
+    return InterviewSessionResponse.model_validate(session)
 
 
 @router.get("", response_model=InterviewSessionList)
@@ -86,7 +94,7 @@ async def get_session(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Session not found",
         )
-    return InterviewSessionResponse.from_orm_model(session)
+    return InterviewSessionResponse.model_validate(session)
 
 
 @router.get("/{session_id}/feedback", response_model=InterviewFeedback)
@@ -186,4 +194,78 @@ async def complete_session(
     session = await SessionService.complete_session(db, session, feedback_data, duration_seconds)
     await db.commit()
 
-    return InterviewSessionResponse.from_orm_model(session)
+    return InterviewSessionResponse.model_validate(session)
+
+
+@router.post("/{session_id}/complete/stream")
+async def complete_session_stream(
+    session_id: int,
+    duration_seconds: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Mark a session as complete, streaming the feedback as it is generated.
+
+    Responds with Server-Sent Events: ``delta`` events carry fragments of
+    the feedback JSON as the model produces them, and a final ``complete``
+    event carries the updated session once the feedback has been saved.
+
+    Args:
+        session_id: Session ID
+        duration_seconds: Duration of the interview in seconds
+        current_user: Current authenticated user
+        db: Database session
+
+    Returns:
+        Event stream of feedback fragments and the completed session
+
+    Raises:
+        HTTPException: If session not found
+    """
+    session = await SessionService.get_session(db, session_id, current_user.id)
+    if not session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Session not found",
+        )
+
+    user_id = current_user.id
+    question = session.question or "General interview question"
+    transcript = session.transcript or ""
+
+    async def _events() -> AsyncIterator[bytes]:
+        parts = []
+        try:
+            async for delta in ai_service.generate_feedback_stream(
+                question, transcript, duration_seconds
+            ):
+                parts.append(delta)
+                yield _sse_event("delta", {"content": delta})
+            feedback_data = orjson.loads("".join(parts))
+        except Exception:
+            # Use default feedback if AI fails or returns malformed JSON
+            feedback_data = ai_service.default_feedback()
+
+        # The request's session is closed once streaming starts, so persist
+        # the feedback with a session owned by the stream
+        async with async_session_maker() as stream_db:
+            completed = await SessionService.get_session(stream_db, session_id, user_id)
+            if completed is None:
+                yield _sse_event("error", {"detail": "Session not found"})
+                return
+            completed = await SessionService.complete_session(
+                stream_db, completed, feedback_data, duration_seconds
+            )
+            await stream_db.commit()
+
+        yield _sse_event(
+            "complete",
+            InterviewSessionResponse.model_validate(completed).model_dump(mode="json"),
+        )
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,6 +1,7 @@
 """
 File upload API endpoints for S3 presigned URLs.
 """
+import asyncio
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -11,10 +12,17 @@ from app.db.base import get_db
 from app.models.user import User
 from app.models.upload import Upload
 from app.schemas.upload import PresignRequest, PresignResponse, UploadConfirm
-from app.services.s3_service import S3Service
+from app.services.registry import s3_service
 
 router = APIRouter()
-s3_service = S3Service()
+
+# Content types for uploaded media, keyed by file extension
+_CONTENT_TYPE_MAP = {
+    "m4a": "audio/m4a",
+    "mp3": "audio/mpeg",
+    "wav": "audio/wav",
+    "mp4": "video/mp4",
+}
 
 
 @router.post("/s3-presign", response_model=PresignResponse)
@@ -71,37 +79,39 @@ async def confirm_upload(
     Raises:
         HTTPException: If confirmation fails
     """
+    size_task = None
     try:
-        # Get file size from S3
-        file_size = await s3_service.get_file_size(confirm.key)
-
         # Determine content type from key extension
-        extension = confirm.key.split(".")[-1]
-        content_type_map = {
-            "m4a": "audio/m4a",
-            "mp3": "audio/mpeg",
-            "wav": "audio/wav",
-            "mp4": "video/mp4",
-        }
-        content_type = content_type_map.get(extension, "application/octet-stream")
+        extension = confirm.key.rpartition(".")[2]
+        content_type = _CONTENT_TYPE_MAP.get(extension, "application/octet-stream")
 
         # Convert timestamp from milliseconds to datetime
-        uploaded_at = datetime.fromtimestamp(confirm.uploaded_at / 1000, tz=timezone.utc)
+        uploaded_at = datetime.fromtimestamp(confirm.uploaded_at / 1000, timezone.utc)
+
+        # Run the S3 HEAD request while the record is inserted, then fill in
+        # the size before committing
+        size_task = asyncio.create_task(s3_service.get_file_size(confirm.key))
 
         # Create upload record
         upload = Upload(
             user_id=current_user.id,
             s3_key=confirm.key,
             content_type=content_type,
-            file_size=file_size,
             uploaded_at=uploaded_at,
         )
         db.add(upload)
+        await db.flush()
+
+        upload.file_size = await size_task
         await db.commit()
 
         return {"message": "Upload confirmed successfully", "key": confirm.key}
 
     except Exception as e:
+        if size_task is not None:
+            # Don't leave the HEAD request running or its error unretrieved
+            size_task.cancel()
+            await asyncio.gather(size_task, return_exceptions=True)
         await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,243 +1,431 @@
 """
 WebSocket endpoint for real-time transcription.
 """
-import json
-from typing import Dict, Optional
+import asyncio
+import itertools
+import uuid
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple, Union
 
+import orjson
+import ormsgpack
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import get_logger
-from app.core.security import decode_token
+from app.core.security import decode_token_cached
 from app.db.base import get_db
 from app.services.user_service import UserService
 from app.services.session_service import SessionService
-from app.services.ai_service import AIService
-from app.services.tts_service import TTSService
+from app.services.ai_service import AudioTooLargeError
+from app.services.registry import ai_service, tts_service
 
 logger = get_logger(__name__)
 router = APIRouter()
-ai_service = AIService()
-tts_service = TTSService()
+
+
+# Bound on queued outgoing messages per connection; the oldest is dropped on overflow
+SEND_QUEUE_MAXSIZE = 256
+# Maximum number of ready messages coalesced into one batch frame
+SEND_BATCH_SIZE = 128
+# Frame encodings a client may request in its auth message; JSON is the default
+SUPPORTED_ENCODINGS = ("json", "msgpack")
+# Incoming frames are small control messages; larger ones are rejected unparsed
+MAX_INCOMING_FRAME_SIZE = 8192
+
+# Handshake replies never change, so they are serialized once at import
+_ERR_AUTH_REQUIRED = orjson.dumps({"type": "error", "message": "Authentication required"}).decode()
+_ERR_TOKEN_MISSING = orjson.dumps({"type": "error", "message": "Token missing"}).decode()
+_ERR_INVALID_TOKEN = orjson.dumps({"type": "error", "message": "Invalid token"}).decode()
+_AUTH_SUCCESS = {
+    (batch, encoding): orjson.dumps(
+        {"type": "auth_success", "batch": batch, "encoding": encoding}
+    ).decode()
+    for batch in (False, True)
+    for encoding in SUPPORTED_ENCODINGS
+}
+
+
+class ConnectionState:
+    """Per-connection state kept by the connection manager."""
+
+    __slots__ = (
+        "ws", "user_id", "queue", "writer_task", "tasks",
+        "batch", "encoding", "question", "session_id", "connection_id", "interaction_ids",
+    )
+
+    def __init__(self, ws: WebSocket, user_id: int, batch: bool = False, encoding: str = "json"):
+        self.ws = ws
+        self.user_id = user_id
+        self.queue: "asyncio.Queue[dict]" = asyncio.Queue(maxsize=SEND_QUEUE_MAXSIZE)
+        self.writer_task: Optional[asyncio.Task] = None
+        # Background work (transcriptions) started for this connection
+        self.tasks: Set[asyncio.Task] = set()
+        self.batch = batch
+        self.encoding = encoding
+        self.question: Optional[str] = None
+        self.session_id: Optional[int] = None
+        # Unique per connection, so AI audio keys never collide across
+        # reconnects; turns within the connection are numbered in sequence
+        self.connection_id = uuid.uuid4().hex
+        self.interaction_ids = itertools.count(1)
 
 
 class ConnectionManager:
-    """Manage WebSocket connections."""
+    """Manage WebSocket connections and their outgoing message queues."""
 
     def __init__(self):
-        self.active_connections: Dict[int, WebSocket] = {}
-
-    async def connect(self, user_id: int, websocket: WebSocket):
-        """Accept and store WebSocket connection."""
-        await websocket.accept()
-        self.active_connections[user_id] = websocket
+        self.active_connections: Dict[int, ConnectionState] = {}
+
+    async def connect(
+        self,
+        user_id: int,
+        websocket: WebSocket,
+        batch: bool = False,
+        encoding: str = "json",
+    ) -> ConnectionState:
+        """
+        Store an accepted WebSocket connection and start its writer task.
+
+        Args:
+            user_id: Connected user ID
+            websocket: Accepted WebSocket connection
+            batch: Whether the client opted in to batch frames
+            encoding: Frame encoding negotiated during auth
+
+        Returns:
+            State of the new connection
+        """
+        state = ConnectionState(websocket, user_id, batch=batch, encoding=encoding)
+        state.writer_task = asyncio.create_task(self._write_loop(user_id, state))
+        previous = self.active_connections.get(user_id)
+        if previous is not None and previous.writer_task is not None:
+            # A newer socket for the same user replaces the old one
+            previous.writer_task.cancel()
+        self.active_connections[user_id] = state
         logger.info(f"WebSocket connected for user {user_id}")
+        return state
 
-    def disconnect(self, user_id: int):
-        """Remove WebSocket connection."""
-        if user_id in self.active_connections:
-            del self.active_connections[user_id]
-            logger.info(f"WebSocket disconnected for user {user_id}")
+    def disconnect(self, state: ConnectionState):
+        """
+        Stop a connection's writer task and remove it if it is still active.
+
+        A newer connection for the same user is left untouched.
+
+        Args:
+            state: State of the closing connection
+        """
+        if state.writer_task is not None:
+            state.writer_task.cancel()
+        if self.active_connections.get(state.user_id) is state:
+            del self.active_connections[state.user_id]
+        logger.info(f"WebSocket disconnected for user {state.user_id}")
 
     async def send_message(self, user_id: int, message: dict):
-        """Send message to specific user."""
-        if user_id in self.active_connections:
+        """Queue a message for delivery to a specific user."""
+        state = self.active_connections.get(user_id)
+        if state is None:
+            return
+        queue = state.queue
+        if queue.full():
+            queue.get_nowait()
+            logger.warning("Send queue full for user %s, dropped oldest message", user_id)
+        queue.put_nowait(message)
+
+    async def _write_loop(self, user_id: int, state: ConnectionState) -> None:
+        """
+        Drain a connection's queue in order.
+
+        Clients that opted in receive every message that is ready at once as a
+        single ``{"type": "batch", "items": [...]}`` frame; a lone message is
+        sent unwrapped. Other clients get one frame per message.
+        """
+        websocket, queue, batch = state.ws, state.queue, state.batch
+        send = send_msgpack if state.encoding == "msgpack" else send_json
+        while True:
+            items = [await queue.get()]
+            while len(items) < SEND_BATCH_SIZE and not queue.empty():
+                items.append(queue.get_nowait())
             try:
-                await self.active_connections[user_id].send_json(message)
+                if batch and len(items) > 1:
+                    await send(websocket, {"type": "batch", "items": items})
+                else:
+                    for item in items:
+                        await send(websocket, item)
             except Exception as e:
-                logger.error(f"Failed to send message to user {user_id}: {e}")
+                logger.error("Failed to send message to user %s: %s", user_id, e)
 
 
 manager = ConnectionManager()
 
 
-async def authenticate_websocket(websocket: WebSocket) -> Optional[int]:
+async def send_json(websocket: WebSocket, message: dict) -> None:
+    """Serialize a message with orjson and send it as a text frame."""
+    await websocket.send_text(orjson.dumps(message).decode())
+
+
+async def send_msgpack(websocket: WebSocket, message: dict) -> None:
+    """Serialize a message with MessagePack and send it as a binary frame."""
+    await websocket.send_bytes(ormsgpack.packb(message))
+
+
+def _safe_parse(raw: Union[str, bytes]) -> Optional[dict]:
+    """Parse a JSON message, returning None if it is not a valid JSON object."""
+    try:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+async def receive_frame(websocket: WebSocket) -> Union[str, bytes]:
+    """
+    Receive the payload of the next text or binary frame.
+
+    Reading the raw ASGI message lets orjson parse either frame type directly
+    instead of going through Starlette's own JSON decoding.
+
+    Raises:
+        WebSocketDisconnect: If the client disconnected
+    """
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+    text = message.get("text")
+    return text if text is not None else message.get("bytes") or b""
+
+
+async def authenticate_websocket(websocket: WebSocket) -> Optional[Tuple[int, bool, str]]:
     """
     Authenticate WebSocket connection via auth message.
 
     Args:
-        websocket: WebSocket connection
+        websocket: Accepted WebSocket connection
 
     Returns:
-        User ID if authenticated, None otherwise
+        Tuple of (user ID, batch opt-in, frame encoding) if authenticated,
+        None otherwise
     """
     try:
         # Wait for auth message
-        data = await websocket.receive_json()
+        raw = await receive_frame(websocket)
+        data = _safe_parse(raw) if len(raw) <= MAX_INCOMING_FRAME_SIZE else None
 
-        if data.get("type") != "auth":
-            await websocket.send_json({"type": "error", "message": "Authentication required"})
+        if data is None or data.get("type") != "auth":
+            await websocket.send_text(_ERR_AUTH_REQUIRED)
             return None
 
         token = data.get("token")
         if not token:
-            await websocket.send_json({"type": "error", "message": "Token missing"})
+            await websocket.send_text(_ERR_TOKEN_MISSING)
             return None
 
         # Decode token
-        payload = decode_token(token)
+        payload = decode_token_cached(token)
         if not payload or payload.get("type") != "access":
-            await websocket.send_json({"type": "error", "message": "Invalid token"})
+            await websocket.send_text(_ERR_INVALID_TOKEN)
             return None
 
         user_id = payload.get("sub")
         if not user_id:
-            await websocket.send_json({"type": "error", "message": "Invalid token"})
+            await websocket.send_text(_ERR_INVALID_TOKEN)
             return None
 
-        # Send auth success
-        await websocket.send_json({"type": "auth_success"})
-        return int(user_id)
+        # Confirm auth along with the framing the connection will use;
+        # unknown encodings fall back to JSON
+        batch = data.get("batch") is True
+        encoding = data.get("encoding", "json")
+        if encoding not in SUPPORTED_ENCODINGS:
+            encoding = "json"
+        await websocket.send_text(_AUTH_SUCCESS[batch, encoding])
+        return int(user_id), batch, encoding
 
     except Exception as e:
-        logger.error(f"WebSocket auth error: {e}")
+        logger.error("WebSocket auth error: %s", e)
         return None
 
 
+async def _transcribe_and_enqueue(
+    audio_key: str,
+    connection_id: str,
+    interaction_id: int,
+    user_id: int,
+) -> None:
+    """
+    Transcribe an uploaded audio clip and queue the transcript and AI reply.
+
+    Args:
+        audio_key: S3 key of the uploaded audio
+        connection_id: Unique ID of the WebSocket connection, used to name the AI audio file
+        interaction_id: Per-connection sequence number, used to name the AI audio file
+        user_id: Connected user ID
+    """
+    try:
+        # Transcribe audio using AI service
+        transcript_text = await ai_service.transcribe_audio(audio_key)
+
+        # Send transcript back to client
+        await manager.send_message(user_id, {"type": "transcript", "text": transcript_text})
+
+        logger.info("Transcribed audio for user %s: %s...", user_id, transcript_text[:50])
+
+        # Generate AI response based on transcript and question
+        ai_response_text = f"Thank you for your response. That was a good answer about yourself. Let me ask you another question: Can you describe a challenging project you worked on?"
+
+        # For now, use a simple response. In production, you'd call the AI service:
+        # ai_response_text = await ai_service.chat(transcript_text, context=[{"role": "system", "content": f"Question: {question}"}])
+
+        # Generate TTS audio for AI response
+        # There is no DB session record yet, so the connection ID stands in for it
+        ai_audio_s3_key = await tts_service.text_to_speech(
+            text=ai_response_text,
+            interaction_id=interaction_id,
+            s3_key=f"ai-audio/{connection_id}/interaction-{interaction_id}.mp3",
+        )
+
+        if ai_audio_s3_key:
+            # Generate presigned URL for the audio
+            ai_audio_url = await tts_service.get_audio_url(ai_audio_s3_key, expiration=3600)
+
+            # Send AI audio URL to client
+            await manager.send_message(user_id, {
+                "type": "ai_audio_url",
+                "url": ai_audio_url,
+                "text": ai_response_text
+            })
+            logger.info("Generated AI audio for user %s", user_id)
+        else:
+            logger.warning("Failed to generate AI audio for user %s", user_id)
+
+    except AudioTooLargeError as e:
+        logger.warning("Transcription rejected for user %s: %s", user_id, e)
+        await manager.send_message(user_id, {"type": "error", "code": 413, "message": str(e)})
+    except Exception as e:
+        logger.error("Transcription error: %s", e)
+        await manager.send_message(user_id, {"type": "error", "message": "Transcription failed"})
+
+
+async def handle_session_start(state: ConnectionState, data: dict) -> None:
+    """Store the session question and send the AI greeting audio."""
+    user_id = state.user_id
+
+    # Store question for context
+    state.question = data.get("question")
+    logger.info("Session started for user %s: %s", user_id, state.question)
+
+    # Generate TTS audio for the initial AI greeting
+    try:
+        initial_greeting = f"Hello! I am your AI interviewer. When you're ready, turn on your microphone and start speaking. {state.question}"
+
+        # The greeting only depends on the question, so its audio is reused
+        ai_audio_url = await tts_service.get_cached_audio_url(initial_greeting, expiration=3600)
+
+        if ai_audio_url:
+            # Send AI audio URL to client
+            await manager.send_message(user_id, {
+                "type": "ai_audio_url",
+                "url": ai_audio_url,
+                "text": initial_greeting
+            })
+            logger.info("Generated initial AI audio for user %s", user_id)
+    except Exception as e:
+        logger.error("Failed to generate initial AI audio: %s", e)
+
+
+async def handle_audio_uri(state: ConnectionState, data: dict) -> None:
+    """Start transcribing an uploaded clip without blocking the receive loop."""
+    audio_key = data.get("key")
+    if not audio_key:
+        return
+
+    task = asyncio.create_task(
+        _transcribe_and_enqueue(
+            audio_key,
+            state.connection_id,
+            next(state.interaction_ids),
+            state.user_id,
+        )
+    )
+    state.tasks.add(task)
+    task.add_done_callback(state.tasks.discard)
+
+
+# Incoming message type -> handler
+MESSAGE_HANDLERS: Dict[str, Callable[[ConnectionState, dict], Awaitable[None]]] = {
+    "session_start": handle_session_start,
+    "audio_uri": handle_audio_uri,
+}
+
+
 @router.websocket("/transcribe")
 async def websocket_transcribe(websocket: WebSocket):
     """
     WebSocket endpoint for real-time transcription.
 
+    Transcriptions run as background tasks so the receive loop keeps
+    accepting messages while earlier clips are still being processed.
+    All outgoing messages go through the connection manager's
+    per-connection queue; clients may send ``batch: true`` with the auth
+    message to receive ready messages coalesced into batch frames, and
+    ``encoding: 'msgpack'`` to receive every message after auth_success as a
+    binary MessagePack frame instead of JSON text.
+
     Message Types (Incoming):
-        - auth: { type: 'auth', token: string }
+        - auth: { type: 'auth', token: string, batch?: boolean, encoding?: 'json' | 'msgpack' }
         - session_start: { type: 'session_start', question: string }
         - audio_uri: { type: 'audio_uri', key: string, uri: string }
 
     Message Types (Outgoing):
-        - auth_success: { type: 'auth_success' }
+        - auth_success: { type: 'auth_success', batch: boolean, encoding: string }
+        - batch: { type: 'batch', items: object[] } (opt-in only)
         - transcript: { type: 'transcript', text: string }
         - error: { type: 'error', message: string }
     """
     user_id = None
+    state: Optional[ConnectionState] = None
 
     try:
+        # The handshake must be accepted before the auth message can be read
+        await websocket.accept()
+
         # Authenticate
-        user_id = await authenticate_websocket(websocket)
-        if not user_id:
+        auth = await authenticate_websocket(websocket)
+        if auth is None:
             await websocket.close(code=1008)
             return
+        user_id, batch, encoding = auth
 
         # Connect user
-        await manager.connect(user_id, websocket)
-
-        # Store session context
-        current_question = None
-        current_session_id = None
+        state = await manager.connect(user_id, websocket, batch=batch, encoding=encoding)
 
         # Message loop
         while True:
-            try:
-                data = await websocket.receive_json()
-                message_type = data.get("type")
-
-                if message_type == "session_start":
-                    # Store question for context
-                    current_question = data.get("question")
-                    logger.info(f"Session started for user {user_id}: {current_question}")
-
-                    # Generate TTS audio for the initial AI greeting
-                    try:
-                        initial_greeting = f"Hello! I am your AI interviewer. When you're ready, turn on your microphone and start speaking. {current_question}"
-
-                        # Generate TTS audio
-                        temp_session_id = user_id
-                        temp_interaction_id = 0  # Initial greeting
-
-                        ai_audio_s3_key = await tts_service.text_to_speech(
-                            text=initial_greeting,
-                            session_id=temp_session_id,
-                            interaction_id=temp_interaction_id
-                        )
-
-                        if ai_audio_s3_key:
-                            # Generate presigned URL for the audio
-                            ai_audio_url = await tts_service.get_audio_url(ai_audio_s3_key, expiration=3600)
-
-                            # Send AI audio URL to client
-                            await manager.send_message(
-                                user_id,
-                                {
-                                    "type": "ai_audio_url",
-                                    "url": ai_audio_url,
-                                    "text": initial_greeting
-                                }
-                            )
-                            logger.info(f"Generated initial AI audio for user {user_id}")
-                    except Exception as e:
-                        logger.error(f"Failed to generate initial AI audio: {e}")
-
-                elif message_type == "audio_uri":
-                    # Transcribe audio from S3
-                    audio_key = data.get("key")
-                    if audio_key:
-                        try:
-                            # Transcribe audio using AI service
-                            transcript_text = await ai_service.transcribe_audio(audio_key)
-
-                            # Send transcript back to client
-                            await manager.send_message(
-                                user_id,
-                                {"type": "transcript", "text": transcript_text}
-                            )
-
-                            logger.info(f"Transcribed audio for user {user_id}: {transcript_text[:50]}...")
-
-                            # Generate AI response based on transcript and question
-                            ai_response_text = f"Thank you for your response. That was a good answer about yourself. Let me ask you another question: Can you describe a challenging project you worked on?"
-
-                            # For now, use a simple response. In production, you'd call the AI service:
-                            # ai_response_text = await ai_service.chat(transcript_text, context=[{"role": "system", "content": f"Question: {current_question}"}])
-
-                            # Generate TTS audio for AI response
-                            # We need a session_id and interaction_id - for simplicity, we'll create temporary ones
-                            # In a real implementation, you should create actual DB records
-                            temp_session_id = user_id  # Use user_id as temp session_id
-                            temp_interaction_id = int(data.get("timestamp", 1))  # Use timestamp as temp interaction_id
-
-                            ai_audio_s3_key = await tts_service.text_to_speech(
-                                text=ai_response_text,
-                                session_id=temp_session_id,
-                                interaction_id=temp_interaction_id
-                            )
-
-                            if ai_audio_s3_key:
-                                # Generate presigned URL for the audio
-                                ai_audio_url = await tts_service.get_audio_url(ai_audio_s3_key, expiration=3600)
-
-                                # Send AI audio URL to client
-                                await manager.send_message(
-                                    user_id,
-                                    {
-                                        "type": "ai_audio_url",
-                                        "url": ai_audio_url,
-                                        "text": ai_response_text
-                                    }
-                                )
-                                logger.info(f"Generated AI audio for user {user_id}")
-                            else:
-                                logger.warning(f"Failed to generate AI audio for user {user_id}")
-
-                        except Exception as e:
-                            logger.error(f"Transcription error: {e}")
-                            await manager.send_message(
-                                user_id,
-                                {"type": "error", "message": "Transcription failed"}
-                            )
-
-                else:
-                    logger.warning(f"Unknown message type: {message_type}")
-
-            except json.JSONDecodeError:
-                await manager.send_message(
-                    user_id,
-                    {"type": "error", "message": "Invalid JSON"}
-                )
+            raw = await receive_frame(websocket)
+            if len(raw) > MAX_INCOMING_FRAME_SIZE:
+                await manager.send_message(user_id, {"type": "error", "message": "Message too large"})
+                continue
+
+            data = _safe_parse(raw)
+            if data is None:
+                await manager.send_message(user_id, {"type": "error", "message": "Invalid JSON"})
+                continue
+
+            message_type = data.get("type")
+            handler = MESSAGE_HANDLERS.get(message_type) if isinstance(message_type, str) else None
+            if handler is None:
+                logger.warning("Unknown message type: %s", message_type)
+                continue
+            await handler(state, data)
 
     except WebSocketDisconnect:
-        logger.info(f"WebSocket disconnected for user {user_id}")
+        logger.info("WebSocket disconnected for user %s", user_id)
     except Exception as e:
-        logger.error(f"WebSocket error: {e}")
+        logger.error("WebSocket error: %s", e)
     finally:
-        if user_id:
-            manager.disconnect(user_id)
+        # Results can no longer be delivered once the socket is gone
+        if state is not None and state.tasks:
+            pending_tasks = list(state.tasks)
+            for task in pending_tasks:
+                task.cancel()
+            await asyncio.gather(*pending_tasks, return_exceptions=True)
+        if state is not None:
+            manager.disconnect(state)
@@ -2,7 +2,8 @@
 Application configuration management using Pydantic Settings.
 """
 import os
-from typing import List, Optional
+from functools import cached_property, lru_cache
+from typing import Optional, Tuple
 from pydantic import field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -24,15 +25,26 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: Optional[str] = None
     DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    # Recycle connections before MySQL's wait_timeout or the proxy drops them
+    DB_POOL_RECYCLE_SECONDS: int = 3600
+    # Open DB_POOL_SIZE connections at startup instead of on first use
+    DB_POOL_PREWARM: bool = True
 
     # Security
     SECRET_KEY: Optional[str] = None
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    TOKEN_CACHE_TTL_SECONDS: int = 5
+    # Argon2id password hashing cost; lower it only for test environments
+    PASSWORD_HASH_TIME_COST: int = 3
+    PASSWORD_HASH_MEMORY_COST_KIB: int = 65536
+    PASSWORD_HASH_PARALLELISM: int = 4
 
     # CORS
-    CORS_ORIGINS: List[str] = ["http://localhost:8081"]
+    CORS_ORIGINS: Tuple[str, ...] = ("http://localhost:8081",)
     CORS_ALLOW_CREDENTIALS: bool = True
 
     # AWS S3
@@ -46,6 +58,14 @@ class Settings(BaseSettings):
     # AI Services - Groq
     GROQ_API_KEY: Optional[str] = None
     GROQ_MODEL: str = "llama-3.3-70b-versatile"
+    GROQ_CHAT_MODEL: str = "llama-3.1-8b-instant"
+    # Upper bound on the length of a chat reply
+    GROQ_CHAT_MAX_TOKENS: int = 500
+    # Reuse replies to context-free chat messages (exact match after normalizing)
+    CHAT_CACHE_ENABLED: bool = False
+    # Client-side per-model Groq budget; 0 disables the limit
+    GROQ_REQUESTS_PER_MINUTE: int = 0
+    GROQ_TOKENS_PER_MINUTE: int = 0
 
     # LangSmith (Observability)
     LANGSMITH_TRACING: bool = False
@@ -84,24 +104,26 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
-        case_sensitive=True
+        case_sensitive=True,
+        frozen=True,
     )
 
-    @model_validator(mode="after")
-    def set_database_url(self):
+    @model_validator(mode="before")
+    @classmethod
+    def set_database_url(cls, data):
         """Set DATABASE_URL from Railway's MYSQL_URL if not provided."""
-        if not self.DATABASE_URL:
+        if isinstance(data, dict) and not data.get("DATABASE_URL"):
             mysql_url = os.getenv("MYSQL_URL")
             if mysql_url:
                 # Convert mysql:// to mysql+aiomysql://
-                self.DATABASE_URL = mysql_url.replace("mysql://", "mysql+aiomysql://")
-            else:
-                raise ValueError("DATABASE_URL or MYSQL_URL must be set")
-        return self
+                data = {**data, "DATABASE_URL": mysql_url.replace("mysql://", "mysql+aiomysql://")}
+        return data
 
     @model_validator(mode="after")
     def validate_required_fields(self):
         """Validate required fields are set."""
+        if not self.DATABASE_URL:
+            raise ValueError("DATABASE_URL or MYSQL_URL must be set")
         if not self.SECRET_KEY:
             raise ValueError("SECRET_KEY environment variable is required")
         if not self.GROQ_API_KEY:
@@ -114,13 +136,19 @@ class Settings(BaseSettings):
     def parse_cors_origins(cls, v):
         """Parse CORS origins from string or list."""
         if isinstance(v, str):
-            return [origin.strip() for origin in v.split(",")]
+            return tuple(origin.strip() for origin in v.split(","))
         return v
 
-    @property
+    @cached_property
     def database_url_sync(self) -> str:
         """Get synchronous database URL for Alembic."""
         return self.DATABASE_URL.replace("+aiomysql", "+pymysql") if self.DATABASE_URL else ""
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings instance, validated once."""
+    return Settings()
+
+
+settings = get_settings()
@@ -1,18 +1,33 @@
 """
 Security utilities for authentication and authorization.
 """
+import asyncio
+import hashlib
+import threading
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Optional, Tuple
 
+from cachetools import TTLCache
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
 
-# Password hashing context using Argon2 (more modern, no length limits)
+# Cache of verified token payloads keyed by sha256(token), never the raw token
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=settings.TOKEN_CACHE_TTL_SECONDS)
+_token_cache_lock = threading.Lock()
+
+# Password hashing context using Argon2id (more modern, no length limits).
+# The cost parameters are stored in each hash, so existing hashes keep
+# verifying after the settings change.
 pwd_context = CryptContext(
     schemes=["argon2"],
-    deprecated="auto"
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__rounds=settings.PASSWORD_HASH_TIME_COST,
+    argon2__memory_cost=settings.PASSWORD_HASH_MEMORY_COST_KIB,
+    argon2__parallelism=settings.PASSWORD_HASH_PARALLELISM,
 )
 
 
@@ -26,6 +41,16 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password in a worker thread; Argon2 takes ~100ms of CPU."""
+    return await asyncio.to_thread(pwd_context.verify, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password in a worker thread; Argon2 takes ~100ms of CPU."""
+    return await asyncio.to_thread(pwd_context.hash, password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT access token.
@@ -37,16 +62,12 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     Returns:
         Encoded JWT token string
     """
-    to_encode = data.copy()
-
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+    if expires_delta is None:
+        expires_delta = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    expire = datetime.now(timezone.utc) + expires_delta
 
-    to_encode.update({"exp": expire, "type": "access"})
+    # Build a new dict so the caller's payload can be shared between tokens
+    to_encode = {**data, "exp": expire, "type": "access"}
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
@@ -61,13 +82,35 @@ def create_refresh_token(data: dict) -> str:
     Returns:
         Encoded JWT refresh token string
     """
-    to_encode = data.copy()
     expire = datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-    to_encode.update({"exp": expire, "type": "refresh"})
+    to_encode = {**data, "exp": expire, "type": "refresh"}
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 
+async def create_token_pair(data: dict) -> Tuple[str, str]:
+    """
+    Create an access token and a refresh token for the same payload.
+
+    HMAC signing is cheap and runs inline; asymmetric algorithms (RS/ES/PS)
+    are signed concurrently in worker threads to keep the event loop free.
+
+    Args:
+        data: Payload data to encode in both tokens
+
+    Returns:
+        Tuple of (access token, refresh token)
+    """
+    if settings.ALGORITHM.startswith("HS"):
+        return create_access_token(data), create_refresh_token(data)
+
+    access_token, refresh_token = await asyncio.gather(
+        asyncio.to_thread(create_access_token, data),
+        asyncio.to_thread(create_refresh_token, data),
+    )
+    return access_token, refresh_token
+
+
 def decode_token(token: str) -> Optional[dict]:
     """
     Decode and verify a JWT token.
@@ -83,3 +126,39 @@ def decode_token(token: str) -> Optional[dict]:
         return payload
     except JWTError:
         return None
+
+
+def decode_token_cached(token: str) -> Optional[dict]:
+    """
+    Decode and verify a JWT token, reusing recently verified payloads.
+
+    Only successfully verified tokens are cached, and cached entries are
+    re-checked against their ``exp`` claim on every hit.
+
+    Args:
+        token: JWT token string
+
+    Returns:
+        Decoded token payload or None if invalid
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    now = time.time()
+
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+    if cached is not None:
+        payload, exp_ts = cached
+        if exp_ts is None or exp_ts > now:
+            return payload
+        with _token_cache_lock:
+            _token_cache.pop(key, None)
+        return None
+
+    payload = decode_token(token)
+    if payload is None:
+        return None
+
+    exp_ts = payload.get("exp")
+    with _token_cache_lock:
+        _token_cache[key] = (payload, exp_ts)
+    return payload
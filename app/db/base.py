@@ -1,12 +1,16 @@
 """
 Database base configuration and session management.
 """
+import asyncio
 from typing import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
 from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
 
 
 # Create async engine
@@ -14,8 +18,9 @@ engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DB_ECHO,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
 )
 
 # Create async session factory
@@ -33,6 +38,32 @@ class Base(DeclarativeBase):
     pass
 
 
+async def warm_pool() -> None:
+    """
+    Open the pool's persistent connections up front.
+
+    The pool otherwise connects lazily, so the first requests after a deploy
+    would each pay a TCP + TLS + MySQL handshake. Failures are logged and
+    left for the pool to retry on demand.
+    """
+    size = getattr(engine.pool, "size", None)
+    if size is None:
+        return
+
+    results = await asyncio.gather(
+        *(engine.connect().start() for _ in range(size())),
+        return_exceptions=True,
+    )
+    connections = [r for r in results if not isinstance(r, BaseException)]
+    await asyncio.gather(*(conn.close() for conn in connections))
+
+    failed = len(results) - len(connections)
+    if failed:
+        logger.warning(f"Database pool warm-up: {failed} of {len(results)} connections failed")
+    else:
+        logger.info(f"Database pool warmed with {len(connections)} connections")
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for getting async database sessions.
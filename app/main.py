@@ -8,11 +8,14 @@ from fastapi.responses import JSONResponse
 
 from app.core.config import settings
 from app.core.logging import setup_logging, get_logger
+from app.db.base import warm_pool
+from app.middleware.auth import setup_auth_middleware
 from app.middleware.cors import setup_cors
 from app.middleware.error_handler import setup_error_handlers
 from app.middleware.rate_limiter import setup_rate_limiting
 from app.middleware.logging_middleware import setup_logging_middleware
-from app.api.endpoints import auth, upload, sessions, ai, websocket, debug, ai_interview
+from app.api.endpoints import auth, upload, sessions, ai, websocket, ai_interview
+from app.services.registry import close_services
 
 # Setup logging (replaces Sentry)
 setup_logging()
@@ -44,10 +47,14 @@ async def lifespan(app: FastAPI):
             os.environ["LANGSMITH_PROJECT"] = settings.LANGSMITH_PROJECT
         logger.info(f"LangSmith tracing enabled for project: {settings.LANGSMITH_PROJECT}")
 
+    if settings.DB_POOL_PREWARM:
+        await warm_pool()
+
     yield
 
     # Shutdown
     logger.info("Shutting down application")
+    await close_services()
 
 
 # Create FastAPI app
@@ -63,6 +70,7 @@ app = FastAPI(
 setup_cors(app)
 setup_logging_middleware(app)  # Logging first to capture all requests
 setup_rate_limiting(app)  # Rate limiting before processing
+setup_auth_middleware(app)  # Decode JWT once so later layers can read request.state
 setup_error_handlers(app)  # Error handling last
 
 
@@ -94,18 +102,27 @@ app.include_router(ai.router, prefix="/ai", tags=["AI"])
 app.include_router(ai_interview.router, prefix="/ai-interview", tags=["AI Interview"])
 app.include_router(websocket.router, prefix="/ws", tags=["WebSocket"])
 
-# Debug endpoints (only for testing Sentry)
+# Debug endpoints (only for testing Sentry); not imported at all in production
 if settings.DEBUG or settings.ENVIRONMENT == "development":
+    from app.api.endpoints import debug
+
     app.include_router(debug.router, prefix="/debug", tags=["Debug"])
 
 
 if __name__ == "__main__":
+    import sys
+
     import uvicorn
 
+    # uvloop and httptools ship with uvicorn[standard] but are not available on Windows
+    runtime = {} if sys.platform == "win32" else {"loop": "uvloop", "http": "httptools"}
+
     uvicorn.run(
         "app.main:app",
         host=settings.HOST,
         port=settings.PORT,
         reload=settings.RELOAD,
         log_level=settings.LOG_LEVEL.lower(),
+        ws="websockets",
+        **runtime,
     )
@@ -0,0 +1,61 @@
+"""
+JWT pre-decoding middleware.
+"""
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.logging import get_logger
+from app.core.security import decode_token_cached
+
+logger = get_logger(__name__)
+
+
+class JWTAuthMiddleware:
+    """
+    Decode the bearer token once per request and stash it on request.state.
+
+    Sets ``request.state.jwt_payload`` and ``request.state.user_id`` when the
+    Authorization header carries a valid token. Rejecting requests is left to
+    the endpoint dependencies; this middleware never short-circuits.
+    Implemented as plain ASGI to avoid BaseHTTPMiddleware's per-request
+    overhead.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            for name, value in scope["headers"]:
+                if name == b"authorization":
+                    self._decode(scope, value)
+                    break
+
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    def _decode(scope: Scope, header: bytes) -> None:
+        """Decode a bearer Authorization header into the request state."""
+        scheme, _, token = header.decode("latin-1").partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return
+
+        payload = decode_token_cached(token)
+        if payload is None:
+            return
+
+        state = scope.setdefault("state", {})
+        state["jwt_payload"] = payload
+        sub = payload.get("sub")
+        if sub is not None and str(sub).isdigit():
+            state["user_id"] = int(sub)
+
+
+def setup_auth_middleware(app) -> None:
+    """
+    Setup JWT pre-decoding middleware.
+
+    Args:
+        app: FastAPI application instance
+    """
+    app.add_middleware(JWTAuthMiddleware)
+    logger.info("JWT auth middleware configured")
@@ -33,7 +33,7 @@ def setup_error_handlers(app: FastAPI) -> None:
     @app.exception_handler(SQLAlchemyError)
     async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError):
         """Handle database errors."""
-        logger.error(f"Database error: {exc}")
+        logger.error("Database error: %s", exc)
 
         # Capture in Sentry
         capture_exception(
@@ -53,7 +53,7 @@ def setup_error_handlers(app: FastAPI) -> None:
     @app.exception_handler(Exception)
     async def general_exception_handler(request: Request, exc: Exception):
         """Handle unexpected errors."""
-        logger.error(f"Unexpected error: {exc}", exc_info=True)
+        logger.error("Unexpected error: %s", exc, exc_info=True)
 
         # Capture in Sentry
         capture_exception(
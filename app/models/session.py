@@ -4,7 +4,7 @@ Interview session database model.
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import String, Text, Integer, Float, DateTime, ForeignKey, func, JSON
+from sqlalchemy import String, Text, Integer, Float, DateTime, ForeignKey, Index, func, JSON, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -17,6 +17,11 @@ class InterviewSession(Base):
     """Interview session model for tracking interview practice sessions."""
 
     __tablename__ = "interview_sessions"
+    __table_args__ = (
+        # Serve the per-user newest-first listing and score aggregates
+        Index("idx_sessions_user_created", "user_id", text("created_at DESC")),
+        Index("idx_sessions_user_score", "user_id", "overall_score"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
@@ -38,16 +43,20 @@ class InterviewSession(Base):
     detailed_feedback: Mapped[str] = mapped_column(Text, nullable=True)
 
     # Metadata
+    # Timestamps are generated client-side so inserts don't need a refresh to
+    # read them back; server_default stays for rows written outside the ORM
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
         server_default=func.now(),
         nullable=False,
         index=True
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
         server_default=func.now(),
-        onupdate=func.now(),
+        onupdate=lambda: datetime.now(timezone.utc),
         nullable=False
     )
     completed_at: Mapped[Optional[datetime]] = mapped_column(
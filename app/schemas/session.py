@@ -4,7 +4,7 @@ Interview session schemas for request/response validation.
 from datetime import datetime
 from typing import Optional, List
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, field_validator
 
 
 class InterviewSessionBase(BaseModel):
@@ -31,21 +31,16 @@ class InterviewSessionResponse(InterviewSessionBase):
 
     model_config = ConfigDict(from_attributes=True)
 
+    @field_validator("id", "user_id", mode="before")
+    @classmethod
+    def stringify_ids(cls, v):
+        """Serialize integer keys as strings."""
+        return str(v)
+
     @classmethod
     def from_orm_model(cls, session):
         """Convert ORM model to response schema."""
-        return cls(
-            id=str(session.id),
-            user_id=str(session.user_id),
-            title=session.title,
-            question=session.question,
-            transcript=session.transcript,
-            audio_s3_key=session.audio_s3_key,
-            duration_seconds=session.duration_seconds,
-            overall_score=session.overall_score,
-            created_at=session.created_at,
-            completed_at=session.completed_at,
-        )
+        return cls.model_validate(session)
 
 
 class InterviewSessionListItem(BaseModel):
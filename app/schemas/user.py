@@ -4,7 +4,7 @@ User schemas for request/response validation.
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr, Field, ConfigDict
+from pydantic import BaseModel, EmailStr, Field, ConfigDict, field_validator
 
 
 class UserBase(BaseModel):
@@ -42,16 +42,16 @@ class UserResponse(UserBase):
 
     model_config = ConfigDict(from_attributes=True)
 
+    @field_validator("id", mode="before")
+    @classmethod
+    def stringify_id(cls, v):
+        """Serialize integer primary keys as strings."""
+        return str(v)
+
     @classmethod
     def from_orm_model(cls, user):
         """Convert ORM model to response schema."""
-        return cls(
-            id=str(user.id),
-            email=user.email,
-            name=user.name,
-            is_active=user.is_active,
-            created_at=user.created_at,
-        )
+        return cls.model_validate(user)
 
 
 class TokenResponse(BaseModel):
@@ -1,32 +1,166 @@
 """
 AI service for chat using Groq.
 """
-import tempfile
-from typing import Dict, List
+import asyncio
+import hashlib
+from functools import cached_property
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
 
-from groq import AsyncGroq
+import httpx
+import orjson
+import tiktoken
+from cachetools import TTLCache
+from groq import AsyncGroq, DefaultAsyncHttpxClient
 
 from app.core.config import settings
 from app.core.logging import get_logger
 from app.core.sentry import start_span, capture_exception, add_breadcrumb, set_context
+from app.services.llm_throttle import LLMThrottle, estimate_tokens
 from app.services.s3_service import S3Service
 
 logger = get_logger(__name__)
 
+# Number of most recent context messages sent with each chat turn
+CHAT_HISTORY_MAX_MESSAGES = 20
+
+# Token budget for a chat request (system message, history and new message);
+# the oldest history turns are dropped to stay within it
+CHAT_CONTEXT_MAX_TOKENS = 6000
+
+# Tokenizer used to measure chat history, loaded on first use. Llama models use
+# their own vocabulary, so cl100k_base is an approximation; None means it could
+# not be loaded and the ~4 characters per token estimate is used instead.
+_UNLOADED = object()
+_encoding = _UNLOADED
+
+# The SDK default (100 connections, 20 kept alive for 5s) is tight once chat,
+# feedback and batched transcriptions run concurrently
+GROQ_HTTP_LIMITS = httpx.Limits(
+    max_connections=200, max_keepalive_connections=100, keepalive_expiry=30.0
+)
+GROQ_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+# Largest file the Whisper transcription endpoint accepts
+WHISPER_MAX_FILE_BYTES = 25 * 1024 * 1024
+
+
+class AudioTooLargeError(ValueError):
+    """Raised when an audio file exceeds Whisper's upload limit."""
+
+# Prompts are built once at import; only the per-request fields are formatted in
+_CHAT_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": (
+        "You are an experienced interview coach helping users practice for job interviews. "
+        "Provide constructive feedback, ask relevant follow-up questions, and help users "
+        "improve their interview skills. Be supportive but honest in your assessments."
+    ),
+}
+
+_FEEDBACK_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are an expert interview coach. Analyze interview responses and provide constructive, actionable feedback. Return valid JSON only.",
+}
+
+_FEEDBACK_PROMPT_TEMPLATE = """Analyze this interview response and provide detailed feedback.
+
+Question: {question}
+
+Response: {transcript}
+
+Duration: {duration_seconds} seconds
+
+Please provide:
+1. An overall score (0-100)
+2. Communication score (0-100)
+3. Technical score (0-100)
+4. Clarity score (0-100)
+5. Top 3 strengths
+6. Top 3 areas for improvement
+7. Detailed feedback paragraph
+
+Format your response as JSON with keys: overall_score, communication_score, technical_score, clarity_score, strengths (array), improvements (array), detailed_feedback (string)."""
+
+
+async def _get_encoding() -> Optional["tiktoken.Encoding"]:
+    """Load the tokenizer once, off the event loop (it may be downloaded)."""
+    global _encoding
+    if _encoding is _UNLOADED:
+        try:
+            _encoding = await asyncio.to_thread(tiktoken.get_encoding, "cl100k_base")
+        except Exception as e:
+            logger.warning(f"Tokenizer unavailable, estimating chat tokens: {e}")
+            _encoding = None
+    return _encoding
+
+
+def _count_tokens(text: str, encoding: Optional["tiktoken.Encoding"]) -> int:
+    """Count tokens in text, or estimate them when no tokenizer is available."""
+    return len(encoding.encode(text)) if encoding else len(text) // 4 + 1
+
+
+def _trim_history(
+    history: List[Dict[str, str]], budget: int, encoding: Optional["tiktoken.Encoding"]
+) -> List[Dict[str, str]]:
+    """Keep the most recent messages whose combined tokens fit in ``budget``."""
+    kept = 0
+    for m in reversed(history):
+        budget -= _count_tokens(m.get("content") or "", encoding)
+        if budget < 0:
+            break
+        kept += 1
+    return history[len(history) - kept:]
+
 
 class AIService:
     """Service class for AI operations using Groq."""
 
-    def __init__(self):
-        """Initialize Groq client."""
-        self.client = AsyncGroq(api_key=settings.GROQ_API_KEY)
+    def __init__(self, s3_service: Optional[S3Service] = None):
+        """Initialize AI service; the Groq client is created on first use."""
         self.model = settings.GROQ_MODEL
-        self.s3_service = S3Service()
+        self.chat_model = settings.GROQ_CHAT_MODEL
+        self.s3_service = s3_service or S3Service()
+        # (bucket, key, etag) -> transcript, so re-sent clips skip Whisper
+        self._transcript_cache: TTLCache = TTLCache(maxsize=1024, ttl=86400)
+        # sha256(model, question, transcript, duration) -> raw feedback JSON
+        self._feedback_cache: TTLCache = TTLCache(maxsize=1024, ttl=86400)
+        # (model, normalized message) -> reply for context-free chat turns
+        self._chat_cache: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+        # Groq applies rate limits per model, so each model gets its own budget
+        self._throttles: Dict[str, LLMThrottle] = {}
+
+    @cached_property
+    def client(self) -> AsyncGroq:
+        """Lazily created Groq client, reusing one HTTP connection pool."""
+        return AsyncGroq(
+            api_key=settings.GROQ_API_KEY,
+            http_client=DefaultAsyncHttpxClient(limits=GROQ_HTTP_LIMITS, timeout=GROQ_HTTP_TIMEOUT),
+        )
+
+    async def close(self) -> None:
+        """Close the underlying Groq HTTP client if it was ever created."""
+        if "client" in self.__dict__:
+            await self.client.close()
+
+    def _throttle(self, model: str) -> LLMThrottle:
+        """Get the request/token budget for a model."""
+        throttle = self._throttles.get(model)
+        if throttle is None:
+            throttle = self._throttles[model] = LLMThrottle(
+                settings.GROQ_REQUESTS_PER_MINUTE, settings.GROQ_TOKENS_PER_MINUTE
+            )
+        return throttle
 
     async def chat(self, message: str, context: List[Dict[str, str]] = None) -> str:
         """
         Send a chat message and get AI response.
 
+        Chat turns use the faster GROQ_CHAT_MODEL and send only the most recent
+        history. When CHAT_CACHE_ENABLED is set, replies to messages sent without
+        context are reused for messages that differ only in case,
+        whitespace or trailing punctuation. This is an exact-match cache, not
+        a semantic one: Groq has no embeddings endpoint to compare phrasings.
+
         Args:
             message: User's message
             context: Optional conversation history
@@ -34,53 +168,79 @@ class AIService:
         Returns:
             AI assistant's response
         """
+        cache_key = None
+        if settings.CHAT_CACHE_ENABLED and not context:
+            cache_key = (self.chat_model, " ".join(message.lower().split()).rstrip("?!. "))
+            cached = self._chat_cache.get(cache_key)
+            if cached is not None:
+                add_breadcrumb(
+                    "Chat cache hit",
+                    category="ai",
+                    level="info",
+                    data={"model": self.chat_model},
+                )
+                return cached
+
         with start_span("ai.chat", "Groq Chat Completion"):
             add_breadcrumb(
                 "Starting AI chat",
                 category="ai",
                 level="info",
-                data={"model": self.model, "message_length": len(message)}
+                data={"model": self.chat_model, "message_length": len(message)}
             )
 
-            messages = context or []
-
-            # Add system message if not present
-            if not messages or messages[0]["role"] != "system":
-                system_message = {
-                    "role": "system",
-                    "content": (
-                        "You are an experienced interview coach helping users practice for job interviews. "
-                        "Provide constructive feedback, ask relevant follow-up questions, and help users "
-                        "improve their interview skills. Be supportive but honest in your assessments."
-                    ),
-                }
-                messages = [system_message] + messages
-
-            # Add user message
-            messages.append({"role": "user", "content": message})
+            history = context or []
+
+            # Keep the system message (or add the default one) plus recent turns
+            if history and history[0]["role"] == "system":
+                system_message, history = history[0], history[1:]
+            else:
+                system_message = _CHAT_SYSTEM_MESSAGE
+            history = history[-CHAT_HISTORY_MAX_MESSAGES:]
+
+            # Drop the oldest turns that don't fit the token budget left after
+            # the system message and the new user message
+            encoding = await _get_encoding()
+            user_message = {"role": "user", "content": message}
+            budget = (
+                CHAT_CONTEXT_MAX_TOKENS
+                - _count_tokens(system_message["content"], encoding)
+                - _count_tokens(message, encoding)
+            )
+            messages = [system_message, *_trim_history(history, budget, encoding), user_message]
 
             try:
+                throttle = self._throttle(self.chat_model)
+                reserved = estimate_tokens(
+                    (m["content"] for m in messages),
+                    completion_tokens=settings.GROQ_CHAT_MAX_TOKENS,
+                )
+                await throttle.reserve(reserved)
                 response = await self.client.chat.completions.create(
-                    model=self.model,
+                    model=self.chat_model,
                     messages=messages,
                     temperature=0.7,
-                    max_tokens=500,
+                    max_tokens=settings.GROQ_CHAT_MAX_TOKENS,
                 )
+                throttle.settle(reserved, response.usage.total_tokens if response.usage else None)
 
                 set_context("ai_response", {
-                    "model": self.model,
+                    "model": self.chat_model,
                     "tokens_used": response.usage.total_tokens if response.usage else None,
                     "response_length": len(response.choices[0].message.content) if response.choices else 0,
                 })
 
-                return response.choices[0].message.content
+                reply = response.choices[0].message.content
+                if cache_key is not None and reply:
+                    self._chat_cache[cache_key] = reply
+                return reply
 
             except Exception as e:
                 logger.error(f"Chat API error: {e}")
                 capture_exception(
                     e,
                     tags={"service": "ai", "operation": "chat"},
-                    extra={"model": self.model, "message_length": len(message)}
+                    extra={"model": self.chat_model, "message_length": len(message)}
                 )
                 raise
 
@@ -88,11 +248,18 @@ class AIService:
         """
         Transcribe audio file from S3 using Groq Whisper API.
 
+        Transcripts are cached by the object's ETag, so a retried or replayed
+        clip is only transcribed once while its content is unchanged.
+
         Args:
             audio_s3_key: S3 key of the audio file
 
         Returns:
             Transcribed text
+
+        Raises:
+            AudioTooLargeError: If the file is larger than Whisper accepts;
+                long recordings are not split into chunks
         """
         with start_span("ai.transcribe", "Groq Whisper Transcription"):
             add_breadcrumb(
@@ -102,22 +269,34 @@ class AIService:
                 data={"s3_key": audio_s3_key, "model": "whisper-large-v3"}
             )
 
-            # Download audio from S3 to temp file
-            with tempfile.NamedTemporaryFile(suffix=".m4a", delete=False) as temp_file:
-                temp_path = temp_file.name
+            etag, size = await self.s3_service.get_object_metadata(audio_s3_key)
+            cache_key = (self.s3_service.bucket_name, audio_s3_key, etag)
+            cached = self._transcript_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            # Reject oversized clips before paying for the download and upload
+            if size > WHISPER_MAX_FILE_BYTES:
+                logger.warning(f"Audio file {audio_s3_key} is too large to transcribe: {size} bytes")
+                raise AudioTooLargeError("Audio file exceeds the 25 MB transcription limit")
 
             try:
                 with start_span("s3.download", "Download audio from S3"):
-                    self.s3_service.download_file(audio_s3_key, temp_path)
+                    audio_bytes = await self.s3_service.get_object_bytes(audio_s3_key)
+
+                # Whisper infers the format from the filename; uploads are m4a by default
+                filename = audio_s3_key.rpartition("/")[2]
+                if "." not in filename:
+                    filename += ".m4a"
 
                 # Transcribe using Groq Whisper
                 with start_span("ai.whisper", "Groq Whisper API call"):
-                    with open(temp_path, "rb") as audio_file:
-                        response = await self.client.audio.transcriptions.create(
-                            model="whisper-large-v3",
-                            file=audio_file,
-                            response_format="text",
-                        )
+                    await self._throttle("whisper-large-v3").reserve()
+                    response = await self.client.audio.transcriptions.create(
+                        model="whisper-large-v3",
+                        file=(filename, audio_bytes),
+                        response_format="text",
+                    )
 
                 transcript = response.text if hasattr(response, 'text') else str(response)
 
@@ -127,6 +306,7 @@ class AIService:
                     "transcript_length": len(transcript),
                 })
 
+                self._transcript_cache[cache_key] = transcript
                 return transcript
 
             except Exception as e:
@@ -137,11 +317,68 @@ class AIService:
                     extra={"s3_key": audio_s3_key, "model": "whisper-large-v3"}
                 )
                 raise
-            finally:
-                # Clean up temp file
-                import os
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
+
+    async def transcribe_audio_batch(
+        self, audio_s3_keys: List[str], max_concurrency: int = 8
+    ) -> List[Union[str, BaseException]]:
+        """
+        Transcribe several audio files concurrently.
+
+        Args:
+            audio_s3_keys: S3 keys of the audio files
+            max_concurrency: Maximum number of transcriptions in flight
+
+        Returns:
+            Transcripts in input order; a failed file yields its exception
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _transcribe_one(key: str) -> str:
+            async with semaphore:
+                return await self.transcribe_audio(key)
+
+        return await asyncio.gather(
+            *(_transcribe_one(key) for key in audio_s3_keys),
+            return_exceptions=True,
+        )
+
+    def _feedback_request(
+        self, question: str, transcript: str, duration_seconds: int
+    ) -> Tuple[str, List[Dict[str, str]]]:
+        """Build the cache key and chat messages for a feedback request."""
+        prompt = _FEEDBACK_PROMPT_TEMPLATE.format(
+            question=question, transcript=transcript, duration_seconds=duration_seconds
+        )
+
+        cache_key = hashlib.sha256(orjson.dumps(
+            {"m": self.model, "q": question, "t": transcript, "d": duration_seconds}
+        )).hexdigest()
+        messages = [
+            _FEEDBACK_SYSTEM_MESSAGE,
+            {"role": "user", "content": prompt},
+        ]
+        return cache_key, messages
+
+    @staticmethod
+    def default_feedback() -> Dict:
+        """Fallback feedback used when generation fails."""
+        return {
+            "overall_score": 70.0,
+            "communication_score": 70.0,
+            "technical_score": 70.0,
+            "clarity_score": 70.0,
+            "strengths": [
+                "Attempted to answer the question",
+                "Showed engagement",
+                "Completed the response",
+            ],
+            "improvements": [
+                "Provide more specific examples",
+                "Structure your response better",
+                "Expand on technical details",
+            ],
+            "detailed_feedback": "Your response shows effort. Focus on providing more concrete examples and structuring your answers using frameworks like STAR (Situation, Task, Action, Result).",
+        }
 
     async def generate_feedback(
         self, question: str, transcript: str, duration_seconds: int
@@ -149,6 +386,9 @@ class AIService:
         """
         Generate interview feedback based on transcript.
 
+        Feedback for an identical (model, question, transcript, duration) is
+        served from cache, so retries and re-scoring skip the API call.
+
         Args:
             question: Interview question asked
             transcript: User's response transcript
@@ -157,24 +397,16 @@ class AIService:
         Returns:
             Feedback dictionary with scores and recommendations
         """
-        prompt = f"""Analyze this interview response and provide detailed feedback.
-
-Question: {question}
-
-Response: {transcript}
-
-Duration: {duration_seconds} seconds
-
-Please provide:
-1. An overall score (0-100)
-2. Communication score (0-100)
-3. Technical score (0-100)
-4. Clarity score (0-100)
-5. Top 3 strengths
-6. Top 3 areas for improvement
-7. Detailed feedback paragraph
-
-Format your response as JSON with keys: overall_score, communication_score, technical_score, clarity_score, strengths (array), improvements (array), detailed_feedback (string)."""
+        cache_key, messages = self._feedback_request(question, transcript, duration_seconds)
+        cached = self._feedback_cache.get(cache_key)
+        if cached is not None:
+            add_breadcrumb(
+                "Feedback cache hit",
+                category="ai",
+                level="info",
+                data={"model": self.model},
+            )
+            return orjson.loads(cached)
 
         with start_span("ai.feedback", "Generate Interview Feedback"):
             add_breadcrumb(
@@ -189,20 +421,18 @@ Format your response as JSON with keys: overall_score, communication_score, tech
             )
 
             try:
+                throttle = self._throttle(self.model)
+                reserved = estimate_tokens(m["content"] for m in messages)
+                await throttle.reserve(reserved)
                 response = await self.client.chat.completions.create(
                     model=self.model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are an expert interview coach. Analyze interview responses and provide constructive, actionable feedback. Return valid JSON only.",
-                        },
-                        {"role": "user", "content": prompt},
-                    ],
+                    messages=messages,
                     temperature=0.5,
                 )
+                throttle.settle(reserved, response.usage.total_tokens if response.usage else None)
 
-                import json
-                feedback = json.loads(response.choices[0].message.content)
+                content = response.choices[0].message.content
+                feedback = orjson.loads(content)
 
                 set_context("feedback_generation", {
                     "model": self.model,
@@ -210,6 +440,8 @@ Format your response as JSON with keys: overall_score, communication_score, tech
                     "overall_score": feedback.get("overall_score"),
                 })
 
+                # Cache the raw JSON so every hit hands out a fresh dict
+                self._feedback_cache[cache_key] = content
                 return feedback
 
             except Exception as e:
@@ -224,20 +456,104 @@ Format your response as JSON with keys: overall_score, communication_score, tech
                     }
                 )
             # Return default feedback on error
-            return {
-                "overall_score": 70.0,
-                "communication_score": 70.0,
-                "technical_score": 70.0,
-                "clarity_score": 70.0,
-                "strengths": [
-                    "Attempted to answer the question",
-                    "Showed engagement",
-                    "Completed the response",
-                ],
-                "improvements": [
-                    "Provide more specific examples",
-                    "Structure your response better",
-                    "Expand on technical details",
-                ],
-                "detailed_feedback": "Your response shows effort. Focus on providing more concrete examples and structuring your answers using frameworks like STAR (Situation, Task, Action, Result).",
-            }
+            return self.default_feedback()
+
+    async def generate_feedback_stream(
+        self, question: str, transcript: str, duration_seconds: int
+    ) -> AsyncIterator[str]:
+        """
+        Stream interview feedback JSON as the model produces it.
+
+        Yields raw content fragments; joined together they form the same JSON
+        document generate_feedback parses. Complete, valid responses are
+        cached like generate_feedback's, and a cache hit is yielded whole.
+
+        Args:
+            question: Interview question asked
+            transcript: User's response transcript
+            duration_seconds: Duration of the response
+
+        Yields:
+            Fragments of the feedback JSON
+
+        Raises:
+            Exception: If the API call fails; the caller decides on a fallback
+        """
+        cache_key, messages = self._feedback_request(question, transcript, duration_seconds)
+        cached = self._feedback_cache.get(cache_key)
+        if cached is not None:
+            add_breadcrumb(
+                "Feedback cache hit",
+                category="ai",
+                level="info",
+                data={"model": self.model},
+            )
+            yield cached
+            return
+
+        with start_span("ai.feedback", "Stream Interview Feedback"):
+            add_breadcrumb(
+                "Streaming interview feedback",
+                category="ai",
+                level="info",
+                data={
+                    "model": self.model,
+                    "transcript_length": len(transcript),
+                    "duration_seconds": duration_seconds
+                }
+            )
+
+            parts: List[str] = []
+            try:
+                throttle = self._throttle(self.model)
+                reserved = estimate_tokens(m["content"] for m in messages)
+                await throttle.reserve(reserved)
+                usage = None
+                try:
+                    stream = await self.client.chat.completions.create(
+                        model=self.model,
+                        messages=messages,
+                        temperature=0.5,
+                        stream=True,
+                    )
+                    async for chunk in stream:
+                        # Groq reports usage on the final chunk
+                        x_groq = getattr(chunk, "x_groq", None)
+                        usage = chunk.usage or (x_groq.usage if x_groq else None) or usage
+                        if not chunk.choices:
+                            continue
+                        delta = chunk.choices[0].delta.content
+                        if delta:
+                            parts.append(delta)
+                            yield delta
+                finally:
+                    # Without reported usage, charge the prompt plus what was streamed
+                    if usage is not None:
+                        used = usage.total_tokens
+                    else:
+                        used = estimate_tokens(
+                            (m["content"] for m in messages),
+                            completion_tokens=sum(len(part) for part in parts) // 4,
+                        )
+                    throttle.settle(reserved, used)
+
+            except Exception as e:
+                logger.error(f"Feedback streaming error: {e}")
+                capture_exception(
+                    e,
+                    tags={"service": "ai", "operation": "generate_feedback_stream"},
+                    extra={
+                        "model": self.model,
+                        "transcript_length": len(transcript),
+                        "duration": duration_seconds
+                    }
+                )
+                raise
+
+            content = "".join(parts)
+            try:
+                orjson.loads(content)
+            except orjson.JSONDecodeError:
+                logger.warning("Streamed feedback is not valid JSON; not caching it")
+                return
+            self._feedback_cache[cache_key] = content
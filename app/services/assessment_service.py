@@ -6,6 +6,7 @@ from typing import Dict, List, Optional
 from datetime import datetime
 import re
 
+import orjson
 from langchain_groq import ChatGroq
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate
@@ -418,8 +419,6 @@ Format as JSON with keys: strengths (array of strings), improvements (array of s
 
     def _parse_json_response(self, response: str) -> Dict:
         """Parse JSON from LLM response."""
-        import json
-
         try:
             # Try to find JSON in response
             start = response.find("{")
@@ -427,9 +426,9 @@ Format as JSON with keys: strengths (array of strings), improvements (array of s
 
             if start >= 0 and end > start:
                 json_str = response[start:end]
-                return json.loads(json_str)
+                return orjson.loads(json_str)
             else:
-                return json.loads(response)
+                return orjson.loads(response)
 
         except Exception as e:
             logger.error(f"Error parsing JSON response: {e}")
@@ -0,0 +1,101 @@
+"""
+Client-side throttling for LLM API calls.
+"""
+import asyncio
+import time
+from typing import Iterable, Optional
+
+
+class _TokenBucket:
+    """Continuously refilling bucket holding up to one minute of budget."""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` can be taken (0 if available now)."""
+        self._refill(now)
+        missing = min(amount, self.capacity) - self.level
+        return max(0.0, missing / self.rate)
+
+    def take(self, amount: float) -> None:
+        self.level -= min(amount, self.capacity)
+
+    def give_back(self, amount: float) -> None:
+        self.level = min(self.capacity, self.level + amount)
+
+
+class LLMThrottle:
+    """
+    Per-process request and token budget for an LLM provider.
+
+    Callers reserve an estimated token count before each API call and settle
+    it with the real usage afterwards, so bursts wait here briefly instead of
+    triggering 429s and the SDK's exponential backoff. A limit of 0 disables
+    that dimension.
+    """
+
+    def __init__(self, requests_per_minute: int = 0, tokens_per_minute: int = 0):
+        self._requests = _TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self._tokens = _TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self._lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._requests is not None or self._tokens is not None
+
+    async def reserve(self, tokens: int = 0) -> None:
+        """
+        Wait until one request and ``tokens`` tokens fit in the budget.
+
+        Waiters are served in arrival order.
+
+        Args:
+            tokens: Estimated tokens for the call
+        """
+        if not self.enabled:
+            return
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                wait = 0.0
+                if self._requests is not None:
+                    wait = self._requests.wait_time(1, now)
+                if self._tokens is not None:
+                    wait = max(wait, self._tokens.wait_time(tokens, now))
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+
+            if self._requests is not None:
+                self._requests.take(1)
+            if self._tokens is not None:
+                self._tokens.take(tokens)
+
+    def settle(self, reserved: int, used: Optional[int]) -> None:
+        """
+        Correct a reservation with the token usage reported by the API.
+
+        Args:
+            reserved: Tokens passed to reserve()
+            used: Actual tokens used, or None if not reported
+        """
+        if self._tokens is None or used is None:
+            return
+        if used < reserved:
+            self._tokens.give_back(reserved - used)
+        else:
+            self._tokens.take(used - reserved)
+
+
+def estimate_tokens(texts: Iterable[str], completion_tokens: int = 512) -> int:
+    """Rough token estimate (~4 characters per token) plus a completion allowance."""
+    return sum(len(text) for text in texts) // 4 + completion_tokens
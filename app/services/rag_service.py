@@ -6,6 +6,7 @@ This version doesn't require ChromaDB, HuggingFace, or PyTorch dependencies.
 from typing import Dict, List, Optional
 from datetime import datetime
 
+from cachetools import TTLCache
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
@@ -19,6 +20,43 @@ from app.models.session import InterviewSession
 logger = get_logger(__name__)
 
 
+# Personalized interviewer prompt. Everything that is the same for every
+# user and interview type comes first so providers that cache prompt
+# prefixes can reuse it; per-request details follow the separator.
+_PROMPT_STATIC_PREFIX = """You are an experienced interview coach conducting a mock job interview.
+
+**Your Role:**
+- Conduct a realistic interview of the type given below
+- Ask relevant questions based on the candidate's background and experience
+- Provide real-time feedback and encouragement
+- Adapt questions based on the candidate's responses
+- Be supportive but maintain professional interview standards
+- After each response, provide brief constructive feedback before moving to the next question
+
+**Interview Guidelines:**
+- Start with a personalized introduction that references the candidate's background
+- Ask 3-5 relevant questions for this interview session
+- Listen carefully to responses and ask follow-up questions when needed
+- Provide balanced feedback highlighting both strengths and areas for improvement
+- End with actionable recommendations for improvement
+
+Begin the interview now with a warm, personalized introduction."""
+
+_PROMPT_TEMPLATE = _PROMPT_STATIC_PREFIX + """
+
+---
+**Interview Type:** {interview_type}
+
+**Candidate Context:**
+{user_context}"""
+
+_FALLBACK_PROMPT_TEMPLATE = """You are an experienced interview coach conducting a {interview_type} interview.
+Introduce yourself and begin asking relevant interview questions."""
+
+# user_id -> {interview_type: prompt}, shared by every RAGService instance
+_prompt_cache: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+
+
 class RAGService:
     """
     Lightweight RAG service using direct database queries.
@@ -41,10 +79,16 @@ class RAGService:
 
         logger.info("Lightweight RAG service initialization complete")
 
+    @staticmethod
+    def invalidate_cache(user_id: int) -> None:
+        """Drop cached prompts for a user after their user or profile data changes."""
+        _prompt_cache.pop(user_id, None)
+
     async def index_user_context(self, db: AsyncSession, user_id: int) -> bool:
         """
         Index user context (lightweight - just validates user exists).
-        In this version, we don't use vector embeddings - context is fetched on-demand.
+        In this version, we don't use vector embeddings - context is fetched on-demand,
+        so indexing only drops any prompts cached from the previous context.
 
         Args:
             db: Database session
@@ -65,6 +109,8 @@ class RAGService:
             data={"user_id": user_id}
         )
 
+        self.invalidate_cache(user_id)
+
         try:
             # Just verify user exists
             user_result = await db.execute(
@@ -113,11 +159,14 @@ class RAGService:
 
             context_docs = []
 
-            # Fetch user
-            user_result = await db.execute(
-                select(User).where(User.id == user_id)
+            # Fetch user and profile in one round trip
+            result = await db.execute(
+                select(User, UserProfile)
+                .outerjoin(UserProfile, UserProfile.user_id == User.id)
+                .where(User.id == user_id)
             )
-            user = user_result.scalar_one_or_none()
+            row = result.first()
+            user, profile = row if row is not None else (None, None)
 
             if user:
                 basic_info = f"User: {user.name or user.email}\nEmail: {user.email}"
@@ -127,14 +176,8 @@ class RAGService:
                     "type": "basic_info"
                 })
 
-            # Fetch profile
-            profile_result = await db.execute(
-                select(UserProfile).where(UserProfile.user_id == user_id)
-            )
-            profile = profile_result.scalar_one_or_none()
-
             if profile:
-                profile_text = f"Job Title: {profile.job_title or 'Not specified'}\n"
+                profile_text = f"Job Title: {profile.current_role or 'Not specified'}\n"
                 if profile.bio:
                     profile_text += f"Bio: {profile.bio}\n"
                 context_docs.append({
@@ -158,6 +201,9 @@ class RAGService:
         """
         Build a personalized system prompt using database-retrieved context.
 
+        Prompts are cached per (user, interview type) for a few minutes and
+        dropped when the user's context is re-indexed.
+
         Args:
             db: Database session
             user_id: User ID
@@ -166,6 +212,10 @@ class RAGService:
         Returns:
             Personalized system prompt
         """
+        cached = _prompt_cache.get(user_id, {}).get(interview_type)
+        if cached is not None:
+            return cached
+
         try:
             # Retrieve user context from database
             context_docs = await self.retrieve_user_context(
@@ -183,35 +233,17 @@ class RAGService:
             user_context = "\n\n".join(context_parts) if context_parts else "No previous context available."
 
             # Build personalized prompt
-            prompt = f"""You are an experienced interview coach conducting a {interview_type} interview.
-
-**Candidate Context:**
-{user_context}
-
-**Your Role:**
-- Conduct a realistic {interview_type} interview
-- Ask relevant questions based on the candidate's background and experience
-- Provide real-time feedback and encouragement
-- Adapt questions based on the candidate's responses
-- Be supportive but maintain professional interview standards
-- After each response, provide brief constructive feedback before moving to the next question
-
-**Interview Guidelines:**
-- Start with a personalized introduction that references the candidate's background
-- Ask 3-5 relevant questions for this interview session
-- Listen carefully to responses and ask follow-up questions when needed
-- Provide balanced feedback highlighting both strengths and areas for improvement
-- End with actionable recommendations for improvement
-
-Begin the interview now with a warm, personalized introduction."""
+            prompt = _PROMPT_TEMPLATE.format(
+                interview_type=interview_type, user_context=user_context
+            )
 
+            _prompt_cache.setdefault(user_id, {})[interview_type] = prompt
             return prompt
 
         except Exception as e:
             logger.error(f"Error building personalized prompt: {e}", exc_info=True)
             # Return fallback prompt
-            return f"""You are an experienced interview coach conducting a {interview_type} interview.
-Introduce yourself and begin asking relevant interview questions."""
+            return _FALLBACK_PROMPT_TEMPLATE.format(interview_type=interview_type)
 
     async def get_user_summary(self, db: AsyncSession, user_id: int) -> str:
         """
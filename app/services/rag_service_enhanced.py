@@ -6,6 +6,7 @@ import os
 from typing import Dict, List, Optional
 from datetime import datetime
 
+from cachetools import LRUCache
 from langchain_chroma import Chroma
 from langchain_huggingface import HuggingFaceEmbeddings
 from langchain.text_splitter import RecursiveCharacterTextSplitter
@@ -80,6 +81,10 @@ class RAGService:
                     "status": "success"
                 })
 
+            # Retrieval queries come from a small fixed set ("<type> interview
+            # preparation"), so each is embedded once and reused across sessions
+            self._query_embeddings: LRUCache = LRUCache(maxsize=256)
+
             # Initialize text splitter
             self.text_splitter = RecursiveCharacterTextSplitter(
                 chunk_size=500,
@@ -274,7 +279,8 @@ class RAGService:
                             {"user_id": user_id}
                         )
 
-                # Step 6: Add documents to vector store
+                # Step 6: Add documents to vector store; Chroma embeds the
+                # whole list in one embed_documents batch
                 if documents:
                     with track_time("add_to_vector_store", {
                         "user_id": user_id,
@@ -322,6 +328,13 @@ class RAGService:
             })
             return False
 
+    def _embed_query(self, query: str) -> List[float]:
+        """Embed a retrieval query, reusing the vector for repeated queries."""
+        embedding = self._query_embeddings.get(query)
+        if embedding is None:
+            embedding = self._query_embeddings[query] = self.embeddings.embed_query(query)
+        return embedding
+
     def _build_session_summary(self, session: InterviewSession) -> str:
         """Build summary from interview session."""
         session_summary = f"Interview Session: {session.title}\n"
@@ -383,18 +396,11 @@ class RAGService:
                     "query": query or "default",
                     "k": k
                 }):
-                    if query:
-                        results = self.vector_store.similarity_search(
-                            query,
-                            k=k,
-                            filter={"user_id": user_id}
-                        )
-                    else:
-                        results = self.vector_store.similarity_search(
-                            "user profile interview history",
-                            k=k,
-                            filter={"user_id": user_id}
-                        )
+                    results = self.vector_store.similarity_search_by_vector(
+                        self._embed_query(query or "user profile interview history"),
+                        k=k,
+                        filter={"user_id": user_id}
+                    )
 
                 context_docs = []
                 for idx, doc in enumerate(results):
@@ -0,0 +1,18 @@
+"""
+Shared service instances.
+
+Endpoints import services from here so that every router reuses the same
+API clients, connection pools, and in-process caches.
+"""
+from app.services.s3_service import S3Service
+from app.services.ai_service import AIService
+from app.services.tts_service import TTSService
+
+s3_service = S3Service()
+ai_service = AIService(s3_service=s3_service)
+tts_service = TTSService(s3_service=s3_service)
+
+
+async def close_services() -> None:
+    """Release network clients held by the shared services."""
+    await ai_service.close()
@@ -1,10 +1,14 @@
 """
 S3 service for handling file uploads.
 """
+import asyncio
 import uuid
 from datetime import datetime, timezone
+from functools import lru_cache
+from typing import AsyncIterable, Dict, List, Optional, Sequence, Tuple
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from app.core.config import settings
@@ -12,27 +16,51 @@ from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# S3's minimum size for every multipart part except the last
+MULTIPART_MIN_PART_SIZE = 5 * 1024 * 1024
+
+# Parts uploaded in parallel by a single upload
+MULTIPART_MAX_CONCURRENCY = 8
+
+
+@lru_cache(maxsize=1)
+def _get_s3_client():
+    """Create the boto3 S3 client once per process."""
+    client_config = {
+        "aws_access_key_id": settings.AWS_ACCESS_KEY_ID,
+        "aws_secret_access_key": settings.AWS_SECRET_ACCESS_KEY,
+        "region_name": settings.AWS_REGION,
+        # One pooled client serves every worker thread, so keep enough
+        # keep-alive connections for concurrent uploads and downloads; TCP
+        # keepalive stops idle pooled connections being dropped silently
+        "config": Config(
+            max_pool_connections=50,
+            retries={"mode": "standard"},
+            tcp_keepalive=True,
+        ),
+    }
+
+    # Add endpoint_url if provided (for Railway Object Storage)
+    if settings.AWS_ENDPOINT_URL:
+        # Clean up endpoint URL - remove $ prefix if present
+        endpoint_url = settings.AWS_ENDPOINT_URL.lstrip("$")
+        client_config["endpoint_url"] = endpoint_url
+
+    return boto3.client("s3", **client_config)
+
 
 class S3Service:
     """Service class for S3 operations."""
 
     def __init__(self):
-        """Initialize S3 client."""
-        client_config = {
-            "aws_access_key_id": settings.AWS_ACCESS_KEY_ID,
-            "aws_secret_access_key": settings.AWS_SECRET_ACCESS_KEY,
-            "region_name": settings.AWS_REGION,
-        }
-
-        # Add endpoint_url if provided (for Railway Object Storage)
-        if settings.AWS_ENDPOINT_URL:
-            # Clean up endpoint URL - remove $ prefix if present
-            endpoint_url = settings.AWS_ENDPOINT_URL.lstrip("$")
-            client_config["endpoint_url"] = endpoint_url
-
-        self.s3_client = boto3.client("s3", **client_config)
+        """Initialize S3 service; the boto3 client is created on first use."""
         self.bucket_name = settings.S3_BUCKET_NAME
 
+    @property
+    def s3_client(self):
+        """Process-wide boto3 S3 client, shared by every S3Service instance."""
+        return _get_s3_client()
+
     def generate_s3_key(self, user_id: int, extension: str) -> str:
         """
         Generate a unique S3 key for upload.
@@ -89,6 +117,49 @@ class S3Service:
             logger.error(f"Failed to generate presigned URL: {e}")
             raise
 
+    def generate_presigned_urls_batch(
+        self,
+        items: Sequence[Tuple[str, Optional[str]]],
+        expiration: int = None,
+        method: str = "put_object",
+    ) -> List[str]:
+        """
+        Generate presigned URLs for several objects in one pass.
+
+        Signing is local, so this avoids per-call setup rather than network
+        round-trips: the client, bucket and expiry are resolved once and the
+        URLs are signed in a tight loop.
+
+        Args:
+            items: (key, content_type) pairs; content_type may be None
+            expiration: URL expiration time in seconds
+            method: S3 operation method ('put_object' or 'get_object')
+
+        Returns:
+            Presigned URLs in the same order as ``items``
+
+        Raises:
+            ClientError: If presigned URL generation fails
+        """
+        if expiration is None:
+            expiration = settings.S3_PRESIGNED_URL_EXPIRATION
+
+        sign = self.s3_client.generate_presigned_url
+        bucket = self.bucket_name
+        with_content_type = method == "put_object"
+
+        urls = []
+        try:
+            for key, content_type in items:
+                params = {"Bucket": bucket, "Key": key}
+                if with_content_type and content_type:
+                    params["ContentType"] = content_type
+                urls.append(sign(method, Params=params, ExpiresIn=expiration))
+        except ClientError as e:
+            logger.error(f"Failed to generate presigned URLs: {e}")
+            raise
+        return urls
+
     def get_file_url(self, key: str) -> str:
         """
         Get the public URL for an S3 object.
@@ -115,53 +186,164 @@ class S3Service:
             ClientError: If object doesn't exist
         """
         try:
-            response = self.s3_client.head_object(Bucket=self.bucket_name, Key=key)
+            response = await asyncio.to_thread(
+                self.s3_client.head_object, Bucket=self.bucket_name, Key=key
+            )
             return response["ContentLength"]
         except ClientError as e:
             logger.error(f"Failed to get file size for {key}: {e}")
             raise
 
-    def download_file(self, key: str, local_path: str) -> None:
+    async def get_object_metadata(self, key: str) -> Tuple[str, int]:
         """
-        Download a file from S3.
+        Get the ETag and size of an S3 object with a single HEAD request.
 
         Args:
             key: S3 object key
-            local_path: Local file path to save to
+
+        Returns:
+            Tuple of (ETag identifying the current content, size in bytes)
 
         Raises:
-            ClientError: If download fails
+            ClientError: If object doesn't exist
         """
         try:
-            self.s3_client.download_file(self.bucket_name, key, local_path)
+            response = await asyncio.to_thread(
+                self.s3_client.head_object, Bucket=self.bucket_name, Key=key
+            )
+            return response["ETag"], response["ContentLength"]
         except ClientError as e:
-            logger.error(f"Failed to download file {key}: {e}")
+            logger.error(f"Failed to get metadata for {key}: {e}")
             raise
 
-    def upload_file(self, local_path: str, key: str, content_type: str = None) -> None:
+    async def get_object_bytes(self, key: str) -> bytes:
         """
-        Upload a file to S3.
+        Read an S3 object into memory.
 
         Args:
-            local_path: Local file path to upload
             key: S3 object key
-            content_type: MIME type of the file
+
+        Returns:
+            Object content
 
         Raises:
-            ClientError: If upload fails
+            ClientError: If the object can't be read
         """
+        def _read() -> bytes:
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
+            return response["Body"].read()
+
         try:
-            extra_args = {}
-            if content_type:
-                extra_args["ContentType"] = content_type
-
-            self.s3_client.upload_file(
-                local_path,
-                self.bucket_name,
-                key,
-                ExtraArgs=extra_args if extra_args else None
-            )
-            logger.info(f"File uploaded successfully to {key}")
+            return await asyncio.to_thread(_read)
         except ClientError as e:
-            logger.error(f"Failed to upload file to {key}: {e}")
+            logger.error(f"Failed to read file {key}: {e}")
+            raise
+
+    async def upload_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        key: str,
+        content_type: str = None,
+        part_size: int = MULTIPART_MIN_PART_SIZE,
+    ) -> None:
+        """
+        Upload data to S3 while it is still being produced.
+
+        Chunks are gathered into parts of ``part_size`` bytes, and each part is
+        uploaded as soon as it fills, overlapping the upload with production of
+        the rest. Streams that end before filling one part are sent with a
+        single PUT instead.
+
+        Args:
+            chunks: Async iterable of data chunks
+            key: S3 object key
+            content_type: MIME type of the object
+            part_size: Multipart part size in bytes (at least 5 MiB)
+
+        Raises:
+            ClientError: If the upload fails; a started multipart upload is aborted
+        """
+        extra_args = {"ContentType": content_type} if content_type else {}
+        buffer = bytearray()
+        upload_id = None
+        part_tasks: List[asyncio.Task] = []
+        part_slots = asyncio.Semaphore(MULTIPART_MAX_CONCURRENCY)
+
+        def _start_part(body: bytes) -> None:
+            part_tasks.append(asyncio.create_task(
+                self._upload_part(key, upload_id, len(part_tasks) + 1, body, part_slots)
+            ))
+
+        try:
+            async for chunk in chunks:
+                buffer += chunk
+                if len(buffer) >= part_size:
+                    if upload_id is None:
+                        response = await asyncio.to_thread(
+                            self.s3_client.create_multipart_upload,
+                            Bucket=self.bucket_name, Key=key, **extra_args
+                        )
+                        upload_id = response["UploadId"]
+                    _start_part(bytes(buffer))
+                    buffer.clear()
+
+            if upload_id is None:
+                await asyncio.to_thread(
+                    self.s3_client.put_object,
+                    Bucket=self.bucket_name, Key=key, Body=bytes(buffer), **extra_args
+                )
+            else:
+                if buffer:
+                    _start_part(bytes(buffer))
+                parts = await asyncio.gather(*part_tasks)
+                await asyncio.to_thread(
+                    self.s3_client.complete_multipart_upload,
+                    Bucket=self.bucket_name,
+                    Key=key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+            logger.info(f"File uploaded successfully to {key}")
+
+        except BaseException as e:
+            for task in part_tasks:
+                task.cancel()
+            # Wait for in-flight parts before aborting, so none lands after the abort
+            await asyncio.gather(*part_tasks, return_exceptions=True)
+            if upload_id is not None:
+                try:
+                    await asyncio.to_thread(
+                        self.s3_client.abort_multipart_upload,
+                        Bucket=self.bucket_name, Key=key, UploadId=upload_id
+                    )
+                except ClientError as abort_error:
+                    logger.warning(f"Failed to abort multipart upload for {key}: {abort_error}")
+            if isinstance(e, ClientError):
+                logger.error(f"Failed to upload file to {key}: {e}")
             raise
+
+    async def _upload_part(
+        self,
+        key: str,
+        upload_id: str,
+        part_number: int,
+        body: bytes,
+        slots: asyncio.Semaphore,
+    ) -> Dict[str, object]:
+        """Upload one multipart part and return its completion entry."""
+        async with slots:
+            upload = asyncio.ensure_future(asyncio.to_thread(
+                self.s3_client.upload_part,
+                Bucket=self.bucket_name,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=body,
+            ))
+            try:
+                response = await asyncio.shield(upload)
+            except asyncio.CancelledError:
+                # The worker thread can't be interrupted, so let it finish
+                await asyncio.gather(upload, return_exceptions=True)
+                raise
+        return {"ETag": response["ETag"], "PartNumber": part_number}
@@ -2,9 +2,9 @@
 Interview session service for business logic.
 """
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from sqlalchemy import select, func, desc
+from sqlalchemy import case, select, func, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.session import InterviewSession
@@ -31,8 +31,8 @@ class SessionService:
             question=session_data.question,
         )
         db.add(db_session)
+        # The flush fills in the primary key; timestamps come from Python defaults
         await db.flush()
-        await db.refresh(db_session)
         return db_session
 
     @staticmethod
@@ -66,10 +66,10 @@ class SessionService:
     async def get_sessions_list(db: AsyncSession, user_id: int) -> InterviewSessionList:
         """Get formatted list of sessions with statistics."""
         sessions = await SessionService.get_user_sessions(db, user_id)
+        total, average, improvement = await SessionService.get_session_stats(db, user_id)
 
         # Format sessions for display
         session_items = []
-        scores = []
 
         for session in sessions:
             # Format date
@@ -92,27 +92,54 @@ class SessionService:
                 )
             )
 
-            if session.overall_score is not None:
-                scores.append(session.overall_score)
-
-        # Calculate statistics
-        total = len(sessions)
-        average = sum(scores) / len(scores) if scores else 0.0
-
-        # Calculate improvement (compare recent vs older scores)
-        improvement = 0.0
-        if len(scores) >= 2:
-            mid = len(scores) // 2
-            recent_avg = sum(scores[:mid]) / mid
-            older_avg = sum(scores[mid:]) / (len(scores) - mid)
-            improvement = recent_avg - older_avg
-
         stats = InterviewSessionStats(
             total=total, average=round(average, 2), improvement=round(improvement, 2)
         )
 
         return InterviewSessionList(sessions=session_items, stats=stats)
 
+    @staticmethod
+    async def get_session_stats(db: AsyncSession, user_id: int) -> Tuple[int, float, float]:
+        """
+        Aggregate a user's session statistics in a single query.
+
+        Improvement compares the average score of the more recent half of
+        scored sessions with the older half.
+
+        Returns:
+            Tuple of (total sessions, average score, improvement)
+        """
+        scored = (
+            select(
+                InterviewSession.overall_score.label("score"),
+                func.row_number().over(order_by=desc(InterviewSession.created_at)).label("rn"),
+                func.count().over().label("n"),
+            )
+            .where(
+                InterviewSession.user_id == user_id,
+                InterviewSession.overall_score.is_not(None),
+            )
+            .subquery()
+        )
+        half = func.floor(scored.c.n / 2)
+        total_sessions = (
+            select(func.count())
+            .select_from(InterviewSession)
+            .where(InterviewSession.user_id == user_id)
+            .scalar_subquery()
+        )
+
+        result = await db.execute(
+            select(
+                total_sessions,
+                func.avg(scored.c.score),
+                func.avg(case((scored.c.rn <= half, scored.c.score)))
+                - func.avg(case((scored.c.rn > half, scored.c.score))),
+            ).select_from(scored)
+        )
+        total, average, improvement = result.one()
+        return total or 0, float(average or 0.0), float(improvement or 0.0)
+
     @staticmethod
     async def update_session_transcript(
         db: AsyncSession, session: InterviewSession, transcript: str
@@ -120,7 +147,6 @@ class SessionService:
         """Update session transcript."""
         session.transcript = transcript
         await db.flush()
-        await db.refresh(session)
         return session
 
     @staticmethod
@@ -130,7 +156,6 @@ class SessionService:
         """Update session audio reference."""
         session.audio_s3_key = audio_s3_key
         await db.flush()
-        await db.refresh(session)
         return session
 
     @staticmethod
@@ -151,8 +176,9 @@ class SessionService:
         session.improvements = feedback_data.get("improvements", [])
         session.detailed_feedback = feedback_data.get("detailed_feedback")
 
+        # All changed columns go out in one UPDATE; updated_at is set
+        # client-side, so the in-memory object is already current
         await db.flush()
-        await db.refresh(session)
         return session
 
     @staticmethod
@@ -1,9 +1,12 @@
 """
 Text-to-Speech service for generating AI audio responses.
 """
-import tempfile
-import os
-from typing import Optional
+import asyncio
+import hashlib
+import time
+from typing import AsyncIterator, Dict, Iterable, Optional
+
+from cachetools import LRUCache
 from gtts import gTTS
 
 from app.core.config import settings
@@ -13,15 +16,59 @@ from app.services.s3_service import S3Service
 
 logger = get_logger(__name__)
 
+# Cached presigned URLs are re-signed once they are this close to expiring
+_URL_REFRESH_MARGIN_SECONDS = 300
+
+
+async def _stream_speech(tts: gTTS) -> AsyncIterator[bytes]:
+    """
+    Yield MP3 fragments from gTTS as they arrive.
+
+    gTTS fetches audio with blocking HTTP requests, so its stream runs in a
+    worker thread and hands fragments back to the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    done = object()
+
+    def _produce() -> None:
+        try:
+            for fragment in tts.stream():
+                loop.call_soon_threadsafe(queue.put_nowait, fragment)
+        except Exception as e:
+            loop.call_soon_threadsafe(queue.put_nowait, e)
+        else:
+            loop.call_soon_threadsafe(queue.put_nowait, done)
+
+    producer = loop.run_in_executor(None, _produce)
+    while True:
+        item = await queue.get()
+        if item is done:
+            break
+        if isinstance(item, Exception):
+            raise item
+        yield item
+    await producer
+
 
 class TTSService:
     """Service for converting text to speech and uploading to S3."""
 
-    def __init__(self):
+    def __init__(self, s3_service: Optional[S3Service] = None):
         """Initialize TTS service."""
-        self.s3_service = S3Service()
-
-    async def text_to_speech(self, text: str, session_id: int, interaction_id: int) -> Optional[str]:
+        self.s3_service = s3_service or S3Service()
+        # sha256(text) -> s3_key of already synthesized audio
+        self._audio_cache: LRUCache = LRUCache(maxsize=256)
+        # (s3_key, expiration) -> (presigned_url, url_expires_at)
+        self._url_cache: LRUCache = LRUCache(maxsize=10_000)
+
+    async def text_to_speech(
+        self,
+        text: str,
+        session_id: Optional[int] = None,
+        interaction_id: Optional[int] = None,
+        s3_key: Optional[str] = None,
+    ) -> Optional[str]:
         """
         Convert text to speech and upload to S3.
 
@@ -29,6 +76,7 @@ class TTSService:
             text: Text to convert to speech
             session_id: AI interview session ID
             interaction_id: Interaction ID for unique filename
+            s3_key: Explicit S3 key, used instead of the session/interaction path
 
         Returns:
             S3 key of the uploaded audio file, or None if failed
@@ -45,23 +93,20 @@ class TTSService:
                 }
             )
 
-            # Create temporary file for audio
-            temp_file = None
             try:
                 # Generate speech using gTTS
                 tts = gTTS(text=text, lang='en', slow=False)
 
-                # Save to temporary file
-                with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as temp:
-                    temp_file = temp.name
-                    tts.save(temp_file)
-
                 # Generate S3 key
-                s3_key = f"ai-audio/{session_id}/interaction-{interaction_id}.mp3"
+                if s3_key is None:
+                    s3_key = f"ai-audio/{session_id}/interaction-{interaction_id}.mp3"
 
-                # Upload to S3
+                # Upload audio fragments as gTTS produces them, so synthesis
+                # of later text overlaps the upload of earlier parts
                 with start_span("s3.upload", "Upload TTS audio to S3"):
-                    self.s3_service.upload_file(temp_file, s3_key, content_type="audio/mpeg")
+                    await self.s3_service.upload_stream(
+                        _stream_speech(tts), s3_key, content_type="audio/mpeg"
+                    )
 
                 logger.info(f"TTS audio generated and uploaded: {s3_key}")
                 return s3_key
@@ -79,18 +124,12 @@ class TTSService:
                 )
                 return None
 
-            finally:
-                # Clean up temporary file
-                if temp_file and os.path.exists(temp_file):
-                    try:
-                        os.remove(temp_file)
-                    except Exception as e:
-                        logger.warning(f"Failed to clean up temp file {temp_file}: {e}")
-
     async def get_audio_url(self, s3_key: str, expiration: int = 3600) -> Optional[str]:
         """
         Get presigned URL for an audio file.
 
+        Signed URLs are reused until they are close to expiring.
+
         Args:
             s3_key: S3 key of the audio file
             expiration: URL expiration time in seconds (default: 1 hour)
@@ -98,8 +137,15 @@ class TTSService:
         Returns:
             Presigned URL or None if failed
         """
+        cache_key = (s3_key, expiration)
+        now = time.monotonic()
+
+        cached = self._url_cache.get(cache_key)
+        if cached is not None and cached[1] - now > _URL_REFRESH_MARGIN_SECONDS:
+            return cached[0]
+
         try:
-            return self.s3_service.generate_presigned_url(
+            url = self.s3_service.generate_presigned_url(
                 s3_key,
                 expiration=expiration,
                 method="get_object"
@@ -107,3 +153,78 @@ class TTSService:
         except Exception as e:
             logger.error(f"Failed to generate presigned URL for {s3_key}: {e}")
             return None
+
+        self._url_cache[cache_key] = (url, now + expiration)
+        return url
+
+    async def get_audio_urls(
+        self, s3_keys: Iterable[str], expiration: int = 3600
+    ) -> Dict[str, Optional[str]]:
+        """
+        Get presigned URLs for several audio files at once.
+
+        Cached URLs are reused; the rest are signed in a single batch.
+
+        Args:
+            s3_keys: S3 keys of the audio files
+            expiration: URL expiration time in seconds (default: 1 hour)
+
+        Returns:
+            Mapping of S3 key to presigned URL (None if signing failed)
+        """
+        now = time.monotonic()
+        urls: Dict[str, Optional[str]] = {}
+        missing = []
+
+        for s3_key in s3_keys:
+            if s3_key in urls:
+                continue
+            cached = self._url_cache.get((s3_key, expiration))
+            if cached is not None and cached[1] - now > _URL_REFRESH_MARGIN_SECONDS:
+                urls[s3_key] = cached[0]
+            else:
+                urls[s3_key] = None
+                missing.append(s3_key)
+
+        if not missing:
+            return urls
+
+        try:
+            signed = self.s3_service.generate_presigned_urls_batch(
+                [(s3_key, None) for s3_key in missing],
+                expiration=expiration,
+                method="get_object"
+            )
+        except Exception as e:
+            logger.error(f"Failed to generate presigned URLs for {len(missing)} keys: {e}")
+            return urls
+
+        for s3_key, url in zip(missing, signed):
+            urls[s3_key] = url
+            self._url_cache[(s3_key, expiration)] = (url, now + expiration)
+        return urls
+
+    async def get_cached_audio_url(self, text: str, expiration: int = 3600) -> Optional[str]:
+        """
+        Get a presigned URL for speech of fixed text, synthesizing it only once.
+
+        Audio is stored under a content-addressed key so repeated texts (such
+        as session greetings) reuse one upload.
+
+        Args:
+            text: Text to convert to speech
+            expiration: URL expiration time in seconds (default: 1 hour)
+
+        Returns:
+            Presigned URL or None if failed
+        """
+        digest = hashlib.sha256(text.encode()).hexdigest()
+
+        s3_key = self._audio_cache.get(digest)
+        if s3_key is None:
+            s3_key = await self.text_to_speech(text, s3_key=f"ai-audio/cached/{digest}.mp3")
+            if s3_key is None:
+                return None
+            self._audio_cache[digest] = s3_key
+
+        return await self.get_audio_url(s3_key, expiration=expiration)
@@ -3,13 +3,21 @@ User service for business logic related to user management.
 """
 from typing import Optional
 
+from cachetools import TTLCache
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash, get_password_hash_async, verify_password_async
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 
+# Short-lived cache of detached User objects for the authentication hot path
+_user_cache: TTLCache = TTLCache(maxsize=5000, ttl=3)
+
+# Verified against when the email is unknown, so failed logins take as long
+# as wrong passwords and don't reveal which emails are registered
+_DUMMY_PASSWORD_HASH = get_password_hash("dummy-password-for-timing")
+
 
 class UserService:
     """Service class for user-related operations."""
@@ -26,18 +34,41 @@ class UserService:
         result = await db.execute(select(User).where(User.id == user_id))
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_by_id_cached(db: AsyncSession, user_id: int) -> Optional[User]:
+        """
+        Get user by ID, reusing a recently loaded copy when available.
+
+        Returned objects are detached from the session, so callers that need
+        to modify the user must re-load it with get_by_id first.
+        """
+        user = _user_cache.get(user_id)
+        if user is not None:
+            return user
+
+        user = await UserService.get_by_id(db, user_id)
+        if user is not None:
+            db.expunge(user)
+            _user_cache[user_id] = user
+        return user
+
+    @staticmethod
+    def invalidate_cache(user_id: int) -> None:
+        """Drop the cached copy of a user after it has been modified."""
+        _user_cache.pop(user_id, None)
+
     @staticmethod
     async def create_user(db: AsyncSession, user_data: UserCreate) -> User:
         """Create a new user."""
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await get_password_hash_async(user_data.password)
         db_user = User(
             email=user_data.email,
             name=user_data.name,
             hashed_password=hashed_password,
         )
         db.add(db_user)
+        # Defaults are all client-side, so the flushed object is complete
         await db.flush()
-        await db.refresh(db_user)
         return db_user
 
     @staticmethod
@@ -45,8 +76,9 @@ class UserService:
         """Authenticate user with email and password."""
         user = await UserService.get_by_email(db, email)
         if not user:
+            await verify_password_async(password, _DUMMY_PASSWORD_HASH)
             return None
-        if not verify_password(password, user.hashed_password):
+        if not await verify_password_async(password, user.hashed_password):
             return None
         return user
 
@@ -55,13 +87,16 @@ class UserService:
         db: AsyncSession, user: User, user_data: UserUpdate
     ) -> User:
         """Update user information."""
+        # The authenticated user may be a detached cached copy; load a
+        # session-bound instance so the changes are flushed
+        user = await UserService.get_by_id(db, user.id)
         update_data = user_data.model_dump(exclude_unset=True)
 
         # Handle password change
         if user_data.new_password and user_data.current_password:
-            if not verify_password(user_data.current_password, user.hashed_password):
+            if not await verify_password_async(user_data.current_password, user.hashed_password):
                 raise ValueError("Current password is incorrect")
-            user.hashed_password = get_password_hash(user_data.new_password)
+            user.hashed_password = await get_password_hash_async(user_data.new_password)
             # Remove password fields from update data
             update_data.pop("current_password", None)
             update_data.pop("new_password", None)
@@ -72,5 +107,4 @@ class UserService:
                 setattr(user, field, value)
 
         await db.flush()
-        await db.refresh(user)
         return user
@@ -74,6 +74,8 @@ CREATE TABLE `interview_sessions` (
     KEY `idx_sessions_user_id` (`user_id`),
     KEY `idx_sessions_created_at` (`created_at`),
     KEY `idx_sessions_completed_at` (`completed_at`),
+    KEY `idx_sessions_user_created` (`user_id`, `created_at` DESC),
+    KEY `idx_sessions_user_score` (`user_id`, `overall_score`),
 
     CONSTRAINT `fk_sessions_user_id`
         FOREIGN KEY (`user_id`)
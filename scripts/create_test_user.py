@@ -1,5 +1,9 @@
 """
-Script to create a test user for development.
+Script to create test users for development.
+
+Usage:
+    python scripts/create_test_user.py            # test@example.com
+    python scripts/create_test_user.py 100        # test1..test100@example.com
 """
 import asyncio
 import sys
@@ -8,44 +12,53 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import insert
 from app.db.base import async_session_maker
 from app.core.security import get_password_hash
 from app.models.user import User
 
+PASSWORD = "test123"
 
-async def create_test_user():
-    """Create a test user."""
-    email = "test@example.com"
-    password = "test123"
-    name = "Test User"
-
-    async with async_session_maker() as session:
-        # Check if user already exists
-        from sqlalchemy import select
 
-        result = await session.execute(select(User).where(User.email == email))
-        existing_user = result.scalar_one_or_none()
+async def create_users(count: int) -> None:
+    """
+    Create ``count`` test users in a single multi-row INSERT.
 
-        if existing_user:
-            print(f"User {email} already exists!")
-            return
+    Users share one password, so it is hashed once and reused; INSERT IGNORE
+    skips emails that already exist.
+    """
+    if count == 1:
+        users = [("test@example.com", "Test User")]
+    else:
+        users = [(f"test{i}@example.com", f"Test User {i}") for i in range(1, count + 1)]
 
-        # Create new user
-        user = User(
-            email=email,
-            name=name,
-            hashed_password=get_password_hash(password),
-            is_active=True,
-        )
+    hashed_password = get_password_hash(PASSWORD)
+    stmt = insert(User).prefix_with("IGNORE").values([
+        {
+            "email": email,
+            "name": name,
+            "hashed_password": hashed_password,
+            "is_active": True,
+        }
+        for email, name in users
+    ])
 
-        session.add(user)
+    async with async_session_maker() as session:
+        result = await session.execute(stmt)
         await session.commit()
 
-        print(f"Test user created successfully!")
-        print(f"Email: {email}")
-        print(f"Password: {password}")
+    created = result.rowcount
+    skipped = len(users) - created
+    if created == 0:
+        print("All test users already exist!")
+        return
+
+    print(f"Created {created} test user(s) successfully!")
+    if skipped:
+        print(f"Skipped {skipped} existing user(s)")
+    print(f"Email: {users[0][0]}" if count == 1 else f"Emails: {users[0][0]} .. {users[-1][0]}")
+    print(f"Password: {PASSWORD}")
 
 
 if __name__ == "__main__":
-    asyncio.run(create_test_user())
+    asyncio.run(create_users(int(sys.argv[1]) if len(sys.argv) > 1 else 1))
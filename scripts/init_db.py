@@ -9,9 +9,7 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from sqlalchemy.ext.asyncio import create_async_engine
-from app.core.config import settings
-from app.db.base import Base
+from app.db.base import Base, engine
 from app.models import User, InterviewSession, Upload
 
 
@@ -19,8 +17,7 @@ async def init_db():
     """Initialize database tables."""
     print("Creating database tables...")
 
-    engine = create_async_engine(settings.DATABASE_URL, echo=True)
-
+    # Reuse the app's engine; SQL echo follows the DB_ECHO setting
     async with engine.begin() as conn:
         # Drop all tables (use with caution in production!)
         # await conn.run_sync(Base.metadata.drop_all)
@@ -80,7 +80,7 @@ def main():
                         statements.append(stmt)
                         current_statement = []
 
-                # Execute each statement
+                # Execute each statement, so one harmless error doesn't stop the rest
                 executed = 0
                 for stmt in statements:
                     if stmt.strip():
@@ -110,14 +110,17 @@ def main():
                     table_name = list(table_dict.values())[0]
                     print(f"  • {table_name}")
 
-                # Get row counts
+                # Get exact row counts for every table in one round trip
                 print_info("\nTable statistics:")
-                for table_dict in tables:
-                    table_name = list(table_dict.values())[0]
-                    cursor.execute(f"SELECT COUNT(*) as count FROM `{table_name}`;")
-                    result = cursor.fetchone()
-                    count = result['count']
-                    print(f"  • {table_name}: {count} rows")
+                table_names = [list(table_dict.values())[0] for table_dict in tables]
+                if table_names:
+                    count_sql = " UNION ALL ".join(
+                        f"SELECT '{table_name}' AS table_name, COUNT(*) AS count FROM `{table_name}`"
+                        for table_name in table_names
+                    )
+                    cursor.execute(count_sql)
+                    for row in cursor.fetchall():
+                        print(f"  • {row['table_name']}: {row['count']} rows")
 
                 print_header("Setup Complete")
                 print_success("Database schema setup completed successfully!")
@@ -1,17 +1,73 @@
 """
 Pytest configuration and shared fixtures for testing Railway API endpoints.
 """
+import asyncio
+import importlib.util
 import os
-from typing import Generator, Dict, Any
+import secrets
+import uuid
+from typing import AsyncGenerator, Dict, Any
 import pytest
+import pytest_asyncio
 import httpx
 from faker import Faker
+from pytest_asyncio import is_async_test
 
 # Railway API endpoint
 BASE_URL = os.getenv("API_URL", "https://genai-coach-backend-production.up.railway.app")
 
 fake = Faker()
 
+# HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# The session client is shared by every test (and gathered requests), so keep
+# plenty of idle connections alive between tests instead of re-handshaking
+_HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100, keepalive_expiry=30.0)
+# LLM-backed endpoints (chat, session completion) can take well over 30s to
+# answer, but connecting or waiting for a pooled connection should be quick
+_HTTP_TIMEOUT = httpx.Timeout(connect=5.0, read=60.0, write=10.0, pool=5.0)
+
+# Connection attempts retried on connect errors/timeouts before a test fails
+_CONNECT_RETRIES = 2
+
+# Set by pytest-xdist in each worker process
+_WORKER_ID = os.getenv("PYTEST_XDIST_WORKER", "main")
+
+def _make_email() -> str:
+    """Email that can't collide across xdist workers or earlier test runs."""
+    return f"test-{_WORKER_ID}-{uuid.uuid4().hex[:12]}@example.com"
+
+
+def _make_password() -> str:
+    """Random password that always has upper case, a digit and a special character."""
+    return secrets.token_urlsafe(12) + "A1!"
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list) -> None:
+    """
+    Run every async test on the session event loop, so the session-scoped
+    client can be shared.
+
+    Session-scoped fixtures such as ``test_user`` are created once per xdist
+    worker, so tests that use them need no grouping to run in parallel; each
+    worker's registration still counts against the backend's rate limit.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run the async tests on uvloop when it is installed (not on Windows)."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
 
 @pytest.fixture(scope="session")
 def base_url() -> str:
@@ -19,21 +75,39 @@ def base_url() -> str:
     return BASE_URL
 
 
-@pytest.fixture
-async def client(base_url: str) -> Generator[httpx.AsyncClient, None, None]:
-    """Create an async HTTP client for testing."""
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client(base_url: str) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Create one async HTTP client, and connection pool, for the test session."""
     async with httpx.AsyncClient(
         base_url=base_url,
-        timeout=30.0,
+        timeout=_HTTP_TIMEOUT,
         follow_redirects=True,
+        transport=httpx.AsyncHTTPTransport(
+            http2=_HTTP2, retries=_CONNECT_RETRIES, limits=_HTTP_LIMITS
+        ),
     ) as client:
         yield client
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session", autouse=True)
+async def _warm_up_backend(client: httpx.AsyncClient) -> None:
+    """
+    Wake the backend and open a pooled connection before the first test.
+
+    Otherwise a cold start (Railway sleeping the service, lazy DB pool) is
+    charged to whichever test happens to run first. Failures are left for
+    the tests themselves to report.
+    """
+    try:
+        await client.get("/")
+    except httpx.HTTPError:
+        pass
+
+
 @pytest.fixture
 def random_email() -> str:
     """Generate a random email for testing."""
-    return fake.email()
+    return _make_email()
 
 
 @pytest.fixture
@@ -45,54 +119,101 @@ def random_name() -> str:
 @pytest.fixture
 def random_password() -> str:
     """Generate a random password for testing."""
-    return fake.password(length=12, special_chars=True, digits=True, upper_case=True, lower_case=True)
+    return _make_password()
 
 
-@pytest.fixture
-async def test_user(client: httpx.AsyncClient, random_email: str, random_password: str, random_name: str) -> Dict[str, Any]:
+def _register_user(response: httpx.Response, user_data: Dict[str, str]) -> Dict[str, Any]:
+    """Build the test-user dict from a /auth/register response."""
+    if response.status_code != 201:
+        raise Exception(f"Failed to create test user: {response.text}")
+
+    data = response.json()
+    return {
+        **user_data,
+        "user": data["user"],
+        "token": data["token"],
+        "refresh_token": data["refresh_token"],
+    }
+
+
+@pytest.fixture(scope="session")
+def test_user(base_url: str) -> Dict[str, Any]:
     """
-    Create a test user and return user data with tokens.
+    Create one test user shared by the whole test session.
+
+    Registration hashes the password server-side, so sharing the user avoids
+    one slow registration per test. Tests that change the user must restore
+    it in a ``finally`` block, or use ``fresh_user`` when the change can't be
+    undone (such as creating the AI profile).
 
     Returns:
         Dict containing user info, token, and refresh_token
     """
     user_data = {
-        "email": random_email,
-        "password": random_password,
-        "name": random_name,
+        "email": _make_email(),
+        "password": _make_password(),
+        "name": fake.name(),
     }
 
-    response = await client.post("/auth/register", json=user_data)
+    # A sync client keeps this fixture independent of per-test event loops
+    with httpx.Client(
+        base_url=base_url,
+        timeout=_HTTP_TIMEOUT,
+        follow_redirects=True,
+        transport=httpx.HTTPTransport(http2=_HTTP2, retries=_CONNECT_RETRIES),
+    ) as client:
+        response = client.post("/auth/register", json=user_data)
 
-    if response.status_code != 201:
-        raise Exception(f"Failed to create test user: {response.text}")
+    return _register_user(response, user_data)
 
-    data = response.json()
-    return {
+
+@pytest.fixture(scope="session")
+def auth_headers(test_user: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Get authentication headers for authenticated requests.
+
+    Returns:
+        Dict with Authorization header
+    """
+    return {"Authorization": f"Bearer {test_user['token']}"}
+
+
+@pytest.fixture
+async def fresh_user(client: httpx.AsyncClient, random_email: str, random_password: str, random_name: str) -> Dict[str, Any]:
+    """
+    Create a test user for a single test, for tests that modify the user.
+
+    Returns:
+        Dict containing user info, token, and refresh_token
+    """
+    user_data = {
         "email": random_email,
         "password": random_password,
         "name": random_name,
-        "user": data["user"],
-        "token": data["token"],
-        "refresh_token": data["refresh_token"],
     }
 
+    response = await client.post("/auth/register", json=user_data)
+    return _register_user(response, user_data)
+
 
 @pytest.fixture
-async def auth_headers(test_user: Dict[str, Any]) -> Dict[str, str]:
+async def fresh_auth_headers(fresh_user: Dict[str, Any]) -> Dict[str, str]:
     """
-    Get authentication headers for authenticated requests.
+    Get authentication headers for a per-test user.
 
     Returns:
         Dict with Authorization header
     """
-    return {"Authorization": f"Bearer {test_user['token']}"}
+    return {"Authorization": f"Bearer {fresh_user['token']}"}
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def test_session(client: httpx.AsyncClient, auth_headers: Dict[str, str]) -> Dict[str, Any]:
     """
-    Create a test interview session.
+    Create one test interview session shared by the whole test session.
+
+    Tests only read it or complete it, and completing is repeatable, so
+    sharing it is safe; tests that need a pristine session create their own.
 
     Returns:
         Dict containing session data
@@ -114,6 +235,25 @@ async def test_session(client: httpx.AsyncClient, auth_headers: Dict[str, str])
     return response.json()
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def ai_available(client: httpx.AsyncClient, auth_headers: Dict[str, str]) -> bool:
+    """
+    Probe the backend's LLM once per session.
+
+    Returns:
+        False if the backend reports a missing or invalid Groq API key
+    """
+    response = await client.post("/ai/chat", json={"message": "ping"}, headers=auth_headers)
+    return not (response.status_code == 500 and "api key" in response.text.lower())
+
+
+@pytest.fixture(autouse=True)
+def _skip_llm_tests_without_ai(request: pytest.FixtureRequest) -> None:
+    """Skip ``llm`` tests when the session probe found no Groq API key."""
+    if request.node.get_closest_marker("llm") and not request.getfixturevalue("ai_available"):
+        pytest.skip("Groq API key not configured on backend")
+
+
 # Test data generators
 @pytest.fixture
 def valid_user_data(random_email: str, random_password: str, random_name: str) -> Dict[str, str]:
@@ -125,9 +265,9 @@ def valid_user_data(random_email: str, random_password: str, random_name: str) -
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_session_data() -> Dict[str, str]:
-    """Generate valid session creation data."""
+    """Valid session creation data, shared by all tests; do not mutate."""
     return {
         "title": "Backend Developer Interview",
         "question": "Describe your experience with RESTful APIs.",
@@ -0,0 +1,6 @@
+"""
+Shared constants for the API test modules.
+"""
+
+# Either status is acceptable for a missing or rejected credential
+UNAUTHORIZED = (401, 403)
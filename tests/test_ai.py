@@ -4,13 +4,40 @@ AI Service API endpoint tests.
 Tests all AI-related endpoints:
 - POST /ai/chat
 
-NOTE: These tests require a valid Groq API key configured on the backend.
-If the Groq API key is invalid or missing, these tests will fail with 500 errors.
-This is expected behavior and indicates the backend needs proper API key configuration.
+NOTE: Tests marked ``llm`` require a valid Groq API key configured on the backend.
+The key is probed once per session (see ``ai_available`` in conftest.py) and the
+``llm`` tests are skipped when the backend reports it missing or invalid.
+Deselect them with ``-m "not llm"`` (``run_tests.py --no-llm``) for a fast run
+that only covers validation and auth.
 """
+import asyncio
+import os
+
 import pytest
 import httpx
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+from helpers import UNAUTHORIZED
+
+# ~3 KB chat message, built once at import
+LONG_MESSAGE = " ".join([
+    "This is a very long message with lots of context about interview preparation.",
+    "I want to know how to prepare for technical interviews at major tech companies.",
+    "What are the best strategies for algorithm and data structure problems?",
+    "How should I practice system design questions?",
+    "What about behavioral interview preparation?",
+] * 10)  # Make it really long
+
+# Upper bound on concurrent /ai/chat calls per worker, so gathered requests
+# don't burst into the backend's rate limit or Groq's
+AI_CONCURRENCY = int(os.getenv("AI_CONCURRENCY", "4"))
+_chat_slots = asyncio.Semaphore(AI_CONCURRENCY)
+
+
+async def _post_chat(client: httpx.AsyncClient, message: str, headers: Dict[str, str]) -> httpx.Response:
+    """POST a chat message, waiting for a free concurrency slot first."""
+    async with _chat_slots:
+        return await client.post("/ai/chat", json={"message": message}, headers=headers)
 
 
 @pytest.mark.ai
@@ -18,6 +45,7 @@ from typing import Dict, Any
 class TestAIChat:
     """Test AI chat endpoint."""
 
+    @pytest.mark.llm
     async def test_chat_success(
         self,
         client: httpx.AsyncClient,
@@ -31,10 +59,6 @@ class TestAIChat:
             headers=auth_headers,
         )
 
-        # AI tests may fail if Groq API key is not configured
-        if response.status_code == 500 and "API key" in response.text:
-            pytest.skip("Groq API key not configured on backend")
-
         assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
         data = response.json()
 
@@ -43,6 +67,7 @@ class TestAIChat:
         assert isinstance(data["reply"], str)
         assert len(data["reply"]) > 0
 
+    @pytest.mark.llm
     async def test_chat_interview_question(
         self,
         client: httpx.AsyncClient,
@@ -64,6 +89,7 @@ class TestAIChat:
         assert "reply" in data
         assert len(data["reply"]) > 0
 
+    @pytest.mark.llm
     async def test_chat_technical_question(
         self,
         client: httpx.AsyncClient,
@@ -104,33 +130,7 @@ class TestAIChat:
         # Should either succeed with generic response or fail validation
         assert response.status_code in [200, 422]
 
-    async def test_chat_long_message(
-        self,
-        client: httpx.AsyncClient,
-        auth_headers: Dict[str, str]
-    ):
-        """Test chat with very long message."""
-        long_message = " ".join([
-            "This is a very long message with lots of context about interview preparation.",
-            "I want to know how to prepare for technical interviews at major tech companies.",
-            "What are the best strategies for algorithm and data structure problems?",
-            "How should I practice system design questions?",
-            "What about behavioral interview preparation?",
-        ] * 10)  # Make it really long
-
-        chat_data = {
-            "message": long_message,
-        }
-
-        response = await client.post(
-            "/ai/chat",
-            json=chat_data,
-            headers=auth_headers,
-        )
-
-        # Should handle long messages
-        assert response.status_code in [200, 413, 422]
-
+    @pytest.mark.llm
     async def test_chat_special_characters(
         self,
         client: httpx.AsyncClient,
@@ -159,7 +159,7 @@ class TestAIChat:
         """Test chat without authentication fails."""
         response = await client.post("/ai/chat", json=valid_chat_message)
 
-        assert response.status_code in [401, 403]
+        assert response.status_code in UNAUTHORIZED
 
     async def test_chat_invalid_token(
         self,
@@ -174,7 +174,7 @@ class TestAIChat:
             headers=headers,
         )
 
-        assert response.status_code in [401, 403]
+        assert response.status_code in UNAUTHORIZED
 
     async def test_chat_missing_message(
         self,
@@ -193,6 +193,7 @@ class TestAIChat:
 
 @pytest.mark.ai
 @pytest.mark.integration
+@pytest.mark.llm
 class TestAIChatIntegration:
     """Integration tests for AI chat functionality."""
 
@@ -201,24 +202,46 @@ class TestAIChatIntegration:
         client: httpx.AsyncClient,
         auth_headers: Dict[str, str]
     ):
-        """Test sending multiple chat messages in sequence."""
+        """Test sending multiple independent chat messages concurrently."""
         messages = [
             "Tell me about technical interviews.",
             "What about behavioral interviews?",
             "How do I prepare for system design?",
         ]
 
-        for message in messages:
-            response = await client.post(
-                "/ai/chat",
-                json={"message": message},
-                headers=auth_headers,
-            )
+        # TaskGroup cancels the remaining requests if one of them fails
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(_post_chat(client, message, auth_headers))
+                for message in messages
+            ]
+        responses = [task.result() for task in tasks]
+
+        for response in responses:
             assert response.status_code == 200
             data = response.json()
             assert "reply" in data
             assert len(data["reply"]) > 0
 
+    async def test_chat_long_message(
+        self,
+        client: httpx.AsyncClient,
+        auth_headers: Dict[str, str]
+    ):
+        """Test chat with very long message."""
+        chat_data = {
+            "message": LONG_MESSAGE,
+        }
+
+        response = await client.post(
+            "/ai/chat",
+            json=chat_data,
+            headers=auth_headers,
+        )
+
+        # Should handle long messages
+        assert response.status_code in [200, 413, 422]
+
     async def test_chat_context_awareness(
         self,
         client: httpx.AsyncClient,
@@ -243,44 +266,39 @@ class TestAIChatIntegration:
         data = response2.json()
         assert "reply" in data
 
+    @pytest.mark.parametrize("topic", [
+        "How do I negotiate salary?",
+        "What should I ask the interviewer?",
+        "How do I handle difficult interview questions?",
+        "Tell me about resume tips.",
+        "What are common interview mistakes?",
+    ])
     async def test_chat_various_topics(
         self,
         client: httpx.AsyncClient,
-        auth_headers: Dict[str, str]
+        auth_headers: Dict[str, str],
+        topic: str
     ):
         """Test chat with various interview-related topics."""
-        topics = [
-            "How do I negotiate salary?",
-            "What should I ask the interviewer?",
-            "How do I handle difficult interview questions?",
-            "Tell me about resume tips.",
-            "What are common interview mistakes?",
-        ]
-
-        for topic in topics:
-            response = await client.post(
-                "/ai/chat",
-                json={"message": topic},
-                headers=auth_headers,
-            )
-            assert response.status_code == 200, f"Failed for topic: {topic}"
-            data = response.json()
-            assert "reply" in data
-            assert len(data["reply"]) > 10  # Should have meaningful response
+        response = await client.post(
+            "/ai/chat",
+            json={"message": topic},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200, f"Failed for topic: {topic}"
+        data = response.json()
+        assert "reply" in data
+        assert len(data["reply"]) > 10  # Should have meaningful response
 
 
 @pytest.mark.ai
+@pytest.mark.llm
 class TestAIChatEdgeCases:
     """Edge case tests for AI chat."""
 
-    async def test_chat_code_in_message(
-        self,
-        client: httpx.AsyncClient,
-        auth_headers: Dict[str, str]
-    ):
-        """Test chat with code snippets in message."""
-        chat_data = {
-            "message": """
+    @pytest.mark.parametrize("message, expected_statuses", [
+        pytest.param(
+            """
             How would you explain this code in an interview?
 
             def fibonacci(n):
@@ -288,26 +306,11 @@ class TestAIChatEdgeCases:
                     return n
                 return fibonacci(n-1) + fibonacci(n-2)
             """,
-        }
-
-        response = await client.post(
-            "/ai/chat",
-            json=chat_data,
-            headers=auth_headers,
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert "reply" in data
-
-    async def test_chat_markdown_in_message(
-        self,
-        client: httpx.AsyncClient,
-        auth_headers: Dict[str, str]
-    ):
-        """Test chat with markdown formatting."""
-        chat_data = {
-            "message": """
+            [200],
+            id="code",
+        ),
+        pytest.param(
+            """
             # Interview Prep
 
             1. **Technical Skills**
@@ -316,53 +319,32 @@ class TestAIChatEdgeCases:
 
             How do I improve in these areas?
             """,
-        }
-
-        response = await client.post(
-            "/ai/chat",
-            json=chat_data,
-            headers=auth_headers,
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert "reply" in data
-
-    async def test_chat_non_english(
-        self,
-        client: httpx.AsyncClient,
-        auth_headers: Dict[str, str]
-    ):
-        """Test chat with non-English characters."""
-        chat_data = {
-            "message": "¿Cómo preparo para una entrevista? 面试准备",
-        }
-
-        response = await client.post(
-            "/ai/chat",
-            json=chat_data,
-            headers=auth_headers,
-        )
-
+            [200],
+            id="markdown",
+        ),
         # Should handle gracefully
-        assert response.status_code in [200, 422]
-
-    async def test_chat_with_urls(
+        pytest.param("¿Cómo preparo para una entrevista? 面试准备", [200, 422], id="non_english"),
+        pytest.param(
+            "I found this article https://example.com/interview-tips. What do you think?",
+            [200],
+            id="urls",
+        ),
+    ])
+    async def test_chat_edge_case(
         self,
         client: httpx.AsyncClient,
-        auth_headers: Dict[str, str]
+        auth_headers: Dict[str, str],
+        message: str,
+        expected_statuses: List[int]
     ):
-        """Test chat with URLs in message."""
-        chat_data = {
-            "message": "I found this article https://example.com/interview-tips. What do you think?",
-        }
-
+        """Test chat with code, markdown, non-English text and URLs in the message."""
         response = await client.post(
             "/ai/chat",
-            json=chat_data,
+            json={"message": message},
             headers=auth_headers,
         )
 
-        assert response.status_code == 200
-        data = response.json()
-        assert "reply" in data
+        assert response.status_code in expected_statuses
+        if response.status_code == 200:
+            data = response.json()
+            assert "reply" in data
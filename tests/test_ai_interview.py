@@ -12,7 +12,7 @@ from app.main import app
 class TestAIInterviewProfile:
     """Tests for user profile endpoints."""
 
-    async def test_create_profile(self, client: AsyncClient, auth_headers: dict):
+    async def test_create_profile(self, client: AsyncClient, fresh_auth_headers: dict):
         """Test creating user profile."""
         profile_data = {
             "current_role": "Software Engineer",
@@ -29,7 +29,7 @@ class TestAIInterviewProfile:
         response = await client.post(
             "/ai-interview/profile",
             json=profile_data,
-            headers=auth_headers
+            headers=fresh_auth_headers
         )
 
         assert response.status_code == 201
@@ -39,11 +39,11 @@ class TestAIInterviewProfile:
         assert "id" in data
         assert "created_at" in data
 
-    async def test_get_profile(self, client: AsyncClient, auth_headers: dict):
+    async def test_get_profile(self, client: AsyncClient, fresh_auth_headers: dict):
         """Test getting user profile."""
         response = await client.get(
             "/ai-interview/profile",
-            headers=auth_headers
+            headers=fresh_auth_headers
         )
 
         assert response.status_code in [200, 404]  # 404 if profile doesn't exist yet
@@ -53,13 +53,13 @@ class TestAIInterviewProfile:
             assert "id" in data
             assert "user_id" in data
 
-    async def test_update_profile(self, client: AsyncClient, auth_headers: dict):
+    async def test_update_profile(self, client: AsyncClient, fresh_auth_headers: dict):
         """Test updating user profile."""
         # First create profile
         await client.post(
             "/ai-interview/profile",
             json={"current_role": "Engineer"},
-            headers=auth_headers
+            headers=fresh_auth_headers
         )
 
         # Update profile
@@ -71,7 +71,7 @@ class TestAIInterviewProfile:
         response = await client.put(
             "/ai-interview/profile",
             json=update_data,
-            headers=auth_headers
+            headers=fresh_auth_headers
         )
 
         assert response.status_code == 200
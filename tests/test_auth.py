@@ -8,10 +8,14 @@ Tests all authentication-related endpoints:
 - POST /auth/logout
 - GET /auth/me
 - PUT /auth/me
+
+Also checks that protected session and upload endpoints require credentials.
 """
 import pytest
 import httpx
-from typing import Dict, Any
+from typing import Any, Dict, Optional
+
+from helpers import UNAUTHORIZED
 
 
 @pytest.mark.auth
@@ -84,20 +88,13 @@ class TestAuthRegistration:
 
         assert response.status_code == 422  # Validation error
 
-    async def test_register_missing_fields(self, client: httpx.AsyncClient):
+    @pytest.mark.parametrize("payload", [
+        pytest.param({"email": "test@example.com", "name": "Test User"}, id="missing_password"),
+        pytest.param({"password": "password123", "name": "Test User"}, id="missing_email"),
+    ])
+    async def test_register_missing_fields(self, client: httpx.AsyncClient, payload: Dict[str, str]):
         """Test registration with missing required fields fails."""
-        # Missing password
-        response = await client.post("/auth/register", json={
-            "email": "test@example.com",
-            "name": "Test User",
-        })
-        assert response.status_code == 422
-
-        # Missing email
-        response = await client.post("/auth/register", json={
-            "password": "password123",
-            "name": "Test User",
-        })
+        response = await client.post("/auth/register", json=payload)
         assert response.status_code == 422
 
 
@@ -143,7 +140,7 @@ class TestAuthLogin:
 
         response = await client.post("/auth/login", json=login_data)
 
-        assert response.status_code in [401, 403]
+        assert response.status_code in UNAUTHORIZED
         data = response.json()
         assert "detail" in data
 
@@ -156,7 +153,7 @@ class TestAuthLogin:
 
         response = await client.post("/auth/login", json=login_data)
 
-        assert response.status_code in [401, 403]
+        assert response.status_code in UNAUTHORIZED
 
     async def test_login_invalid_email_format(self, client: httpx.AsyncClient, random_password: str):
         """Test login with invalid email format fails."""
@@ -169,14 +166,13 @@ class TestAuthLogin:
 
         assert response.status_code == 422  # Validation error
 
-    async def test_login_missing_fields(self, client: httpx.AsyncClient):
+    @pytest.mark.parametrize("payload", [
+        pytest.param({"email": "test@example.com"}, id="missing_password"),
+        pytest.param({"password": "password123"}, id="missing_email"),
+    ])
+    async def test_login_missing_fields(self, client: httpx.AsyncClient, payload: Dict[str, str]):
         """Test login with missing fields fails."""
-        # Missing password
-        response = await client.post("/auth/login", json={"email": "test@example.com"})
-        assert response.status_code == 422
-
-        # Missing email
-        response = await client.post("/auth/login", json={"password": "password123"})
+        response = await client.post("/auth/login", json=payload)
         assert response.status_code == 422
 
 
@@ -213,7 +209,7 @@ class TestAuthRefreshToken:
 
         response = await client.post("/auth/refresh", json=refresh_data)
 
-        assert response.status_code in [401, 403]
+        assert response.status_code in UNAUTHORIZED
 
     async def test_refresh_token_missing(self, client: httpx.AsyncClient):
         """Test refresh with missing token fails."""
@@ -240,44 +236,46 @@ class TestAuthProfile:
         assert data["is_active"] is True
         assert "created_at" in data
 
-    async def test_get_profile_unauthorized(self, client: httpx.AsyncClient):
-        """Test getting profile without authentication fails."""
-        response = await client.get("/auth/me")
-
-        assert response.status_code in [401, 403]
-
     async def test_get_profile_invalid_token(self, client: httpx.AsyncClient):
         """Test getting profile with invalid token fails."""
         headers = {"Authorization": "Bearer invalid.token.here"}
         response = await client.get("/auth/me", headers=headers)
 
-        assert response.status_code in [401, 403]
+        assert response.status_code in UNAUTHORIZED
 
-    async def test_update_profile_name(self, client: httpx.AsyncClient, auth_headers: Dict[str, str]):
+    async def test_update_profile_name(self, client: httpx.AsyncClient, auth_headers: Dict[str, str], test_user: Dict[str, Any]):
         """Test updating user name."""
         update_data = {
             "name": "Updated Name",
         }
 
-        response = await client.put("/auth/me", json=update_data, headers=auth_headers)
+        try:
+            response = await client.put("/auth/me", json=update_data, headers=auth_headers)
 
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
-        data = response.json()
+            assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
+            data = response.json()
 
-        assert data["name"] == "Updated Name"
+            assert data["name"] == "Updated Name"
+        finally:
+            # Restore the shared test user
+            await client.put("/auth/me", json={"name": test_user["name"]}, headers=auth_headers)
 
-    async def test_update_profile_email(self, client: httpx.AsyncClient, auth_headers: Dict[str, str], random_email: str):
+    async def test_update_profile_email(self, client: httpx.AsyncClient, auth_headers: Dict[str, str], test_user: Dict[str, Any], random_email: str):
         """Test updating user email."""
         update_data = {
             "email": random_email,
         }
 
-        response = await client.put("/auth/me", json=update_data, headers=auth_headers)
+        try:
+            response = await client.put("/auth/me", json=update_data, headers=auth_headers)
 
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
-        data = response.json()
+            assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
+            data = response.json()
 
-        assert data["email"] == random_email
+            assert data["email"] == random_email
+        finally:
+            # Restore the shared test user
+            await client.put("/auth/me", json={"email": test_user["email"]}, headers=auth_headers)
 
     async def test_update_profile_password(self, client: httpx.AsyncClient, auth_headers: Dict[str, str], test_user: Dict[str, Any]):
         """Test updating user password."""
@@ -291,19 +289,19 @@ class TestAuthProfile:
 
         assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
 
-        # Verify can login with new password
-        login_response = await client.post("/auth/login", json={
-            "email": test_user["email"],
-            "password": new_password,
-        })
-        assert login_response.status_code == 200
-
-    async def test_update_profile_unauthorized(self, client: httpx.AsyncClient):
-        """Test updating profile without authentication fails."""
-        update_data = {"name": "New Name"}
-        response = await client.put("/auth/me", json=update_data)
-
-        assert response.status_code in [401, 403]
+        try:
+            # Verify can login with new password
+            login_response = await client.post("/auth/login", json={
+                "email": test_user["email"],
+                "password": new_password,
+            })
+            assert login_response.status_code == 200
+        finally:
+            # Restore the shared test user's password
+            await client.put("/auth/me", json={
+                "currentPassword": new_password,
+                "newPassword": test_user["password"],
+            }, headers=auth_headers)
 
 
 @pytest.mark.auth
@@ -319,8 +317,44 @@ class TestAuthLogout:
 
         assert "message" in data
 
-    async def test_logout_unauthorized(self, client: httpx.AsyncClient):
-        """Test logout without authentication fails."""
-        response = await client.post("/auth/logout")
 
-        assert response.status_code in [401, 403]
+@pytest.mark.auth
+@pytest.mark.smoke
+class TestAuthEnforcement:
+    """Test that protected endpoints reject requests without credentials."""
+
+    @pytest.mark.parametrize("method,path,json_body", [
+        ("GET", "/auth/me", None),
+        ("PUT", "/auth/me", {"name": "New Name"}),
+        ("POST", "/auth/logout", None),
+        pytest.param(
+            "POST", "/sessions",
+            {"title": "Test Interview", "question": "Tell me about yourself"},
+            marks=pytest.mark.sessions,
+        ),
+        pytest.param("GET", "/sessions", None, marks=pytest.mark.sessions),
+        pytest.param("GET", "/sessions/1", None, marks=pytest.mark.sessions),
+        pytest.param("POST", "/sessions/1/complete?duration_seconds=180", None, marks=pytest.mark.sessions),
+        pytest.param("GET", "/sessions/1/feedback", None, marks=pytest.mark.sessions),
+        pytest.param(
+            "POST", "/upload/s3-presign",
+            {"content_type": "audio/m4a", "extension": "m4a"},
+            marks=pytest.mark.upload,
+        ),
+        pytest.param(
+            "POST", "/upload/confirm",
+            {"key": "test/audio/sample.m4a", "uploaded_at": 0},
+            marks=pytest.mark.upload,
+        ),
+    ])
+    async def test_requires_auth(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        path: str,
+        json_body: Optional[Dict[str, Any]]
+    ):
+        """Test calling a protected endpoint without authentication fails."""
+        response = await client.request(method, path, json=json_body)
+
+        assert response.status_code in UNAUTHORIZED
@@ -4,16 +4,23 @@ API Health and Basic Connectivity Tests.
 Tests basic API connectivity and health endpoints.
 """
 import pytest
+import pytest_asyncio
 import httpx
 
 
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def root_response(client: httpx.AsyncClient) -> httpx.Response:
+    """Fetch ``GET /`` once; the root endpoint tests only differ in what they assert."""
+    return await client.get("/")
+
+
 @pytest.mark.smoke
 class TestAPIHealth:
     """Test API health and basic connectivity."""
 
-    async def test_api_reachable(self, client: httpx.AsyncClient, base_url: str):
+    async def test_api_reachable(self, root_response: httpx.Response, base_url: str):
         """Test that the API is reachable."""
-        response = await client.get("/")
+        response = root_response
 
         assert response.status_code == 200, f"API not reachable at {base_url}: {response.status_code}"
         data = response.json()
@@ -24,9 +31,9 @@ class TestAPIHealth:
         assert "status" in data
         assert data["status"] == "running"
 
-    async def test_api_info(self, client: httpx.AsyncClient):
+    async def test_api_info(self, root_response: httpx.Response):
         """Test API returns correct information."""
-        response = await client.get("/")
+        response = root_response
 
         assert response.status_code == 200
         data = response.json()
@@ -41,9 +48,9 @@ class TestAPIHealth:
         assert isinstance(data["version"], str)
         assert isinstance(data["environment"], str)
 
-    async def test_cors_headers(self, client: httpx.AsyncClient):
+    async def test_cors_headers(self, root_response: httpx.Response):
         """Test that CORS headers are present."""
-        response = await client.get("/")
+        response = root_response
 
         # CORS headers should be present for web clients
         # Exact headers depend on backend configuration
@@ -1,55 +1,87 @@
 #!/usr/bin/env python3
-"""Verify database schema structure."""
+"""
+Verify database schema structure.
+
+Connection details come from MYSQL_HOST, MYSQL_PORT, MYSQL_USER,
+MYSQL_PASSWORD and MYSQL_DATABASE.
+"""
+import os
+import sys
+from itertools import groupby
+from operator import itemgetter
+
 import pymysql
+import pymysql.cursors
+
+TABLES = ('users', 'interview_sessions', 'uploads')
+COLUMN_WIDTHS = {'users': 20, 'interview_sessions': 25, 'uploads': 20}
+
+
+def load_config():
+    """Read the MySQL connection settings from the environment."""
+    config = {key: os.environ[f"MYSQL_{key.upper()}"] for key in ("host", "port", "user", "password", "database")}
+    config['port'] = int(config['port'])
+    config['charset'] = 'utf8mb4'
+    return config
+
+
+def main():
+    try:
+        mysql_config = load_config()
+    except KeyError as e:
+        print(f"✗ Missing environment variable {e}")
+        sys.exit(1)
+
+    # Server-side cursor streams rows as they are printed; autocommit skips the
+    # implicit rollback on close for this read-only script
+    connection = pymysql.connect(
+        **mysql_config,
+        cursorclass=pymysql.cursors.SSCursor,
+        autocommit=True,
+    )
+    try:
+        with connection.cursor() as cursor:
+            print("\n" + "="*80)
+            print("DATABASE SCHEMA VERIFICATION")
+            print("="*80)
+
+            # One information_schema query per kind of metadata instead of a
+            # DESCRIBE / SHOW INDEX round-trip per table
+            cursor.execute(
+                "SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, COLUMN_KEY "
+                "FROM information_schema.COLUMNS "
+                "WHERE TABLE_SCHEMA = %s AND TABLE_NAME IN (%s, %s, %s) "
+                "ORDER BY FIELD(TABLE_NAME, %s, %s, %s), ORDINAL_POSITION",
+                (mysql_config['database'], *TABLES, *TABLES),
+            )
+            for table, columns in groupby(cursor, key=itemgetter(0)):
+                width = COLUMN_WIDTHS[table]
+                print(f"\n📋 {table.upper()} TABLE:")
+                print("-" * 80)
+                for _, name, column_type, nullable, key in columns:
+                    print(f"  {name:{width}} {column_type:30} {nullable:8} {key:8}")
+
+            # Show indexes
+            print("\n🔑 INDEXES:")
+            print("-" * 80)
+            cursor.execute(
+                "SELECT TABLE_NAME, INDEX_NAME, COLUMN_NAME "
+                "FROM information_schema.STATISTICS "
+                "WHERE TABLE_SCHEMA = %s AND TABLE_NAME IN (%s, %s, %s) "
+                "ORDER BY FIELD(TABLE_NAME, %s, %s, %s), INDEX_NAME, SEQ_IN_INDEX",
+                (mysql_config['database'], *TABLES, *TABLES),
+            )
+            for table, indexes in groupby(cursor, key=itemgetter(0)):
+                print(f"\n  {table.upper()}:")
+                for _, index_name, column_name in indexes:
+                    print(f"    - {index_name:30} on column: {column_name}")
+
+            print("\n" + "="*80)
+            print("✓ Schema verification complete!")
+            print("="*80 + "\n")
+    finally:
+        connection.close()
+
 
-MYSQL_CONFIG = {
-    'host': 'shortline.proxy.rlwy.net',
-    'port': 52538,
-    'user': 'root',
-    'password': 'tTAhOqSOcqIFcTUygPFvaRJowmMPadgn',
-    'database': 'railway',
-    'charset': 'utf8mb4',
-}
-
-connection = pymysql.connect(**MYSQL_CONFIG)
-with connection.cursor() as cursor:
-    print("\n" + "="*80)
-    print("DATABASE SCHEMA VERIFICATION")
-    print("="*80)
-
-    # Check users table
-    print("\n📋 USERS TABLE:")
-    print("-" * 80)
-    cursor.execute("DESCRIBE users;")
-    for row in cursor.fetchall():
-        print(f"  {row[0]:20} {row[1]:30} {row[2]:8} {row[3]:8}")
-
-    # Check interview_sessions table
-    print("\n📋 INTERVIEW_SESSIONS TABLE:")
-    print("-" * 80)
-    cursor.execute("DESCRIBE interview_sessions;")
-    for row in cursor.fetchall():
-        print(f"  {row[0]:25} {row[1]:30} {row[2]:8} {row[3]:8}")
-
-    # Check uploads table
-    print("\n📋 UPLOADS TABLE:")
-    print("-" * 80)
-    cursor.execute("DESCRIBE uploads;")
-    for row in cursor.fetchall():
-        print(f"  {row[0]:20} {row[1]:30} {row[2]:8} {row[3]:8}")
-
-    # Show indexes
-    print("\n🔑 INDEXES:")
-    print("-" * 80)
-    for table in ['users', 'interview_sessions', 'uploads']:
-        cursor.execute(f"SHOW INDEX FROM {table};")
-        indexes = cursor.fetchall()
-        print(f"\n  {table.upper()}:")
-        for idx in indexes:
-            print(f"    - {idx[2]:30} on column: {idx[4]}")
-
-    print("\n" + "="*80)
-    print("✓ Schema verification complete!")
-    print("="*80 + "\n")
-
-connection.close()
+if __name__ == '__main__':
+    main()